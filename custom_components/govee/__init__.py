@@ -12,7 +12,12 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
-from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers import (
+    config_validation as cv,
+    device_registry as dr,
+    entity_registry as er,
+)
+from homeassistant.helpers.typing import ConfigType
 
 from .api import GoveeApiClient, GoveeAuthError, GoveeIotCredentials
 from .api.auth import GoveeAuthClient
@@ -32,8 +37,8 @@ from .const import (
     DEFAULT_POLL_INTERVAL,
     DOMAIN,
 )
-from .coordinator import GoveeCoordinator
-from .services import async_setup_services, async_unload_services
+from .coordinator import GoveeCoordinator, async_remove_scene_store
+from .services import async_setup_services
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -49,6 +54,9 @@ PLATFORMS: list[Platform] = [
     Platform.BUTTON,
 ]
 
+# Config entries only; no YAML configuration
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
 # Type alias for runtime data
 type GoveeConfigEntry = ConfigEntry[GoveeCoordinator]
 
@@ -57,6 +65,24 @@ _KEY_IOT_CREDENTIALS = "iot_credentials"
 _KEY_IOT_LOGIN_FAILED = "iot_login_failed"
 
 
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Govee integration.
+
+    Services are registered once here rather than per config entry, so
+    they exist before any entry loads and stay registered across reloads.
+
+    Args:
+        hass: Home Assistant instance.
+        config: Configuration (unused; config entries only).
+
+    Returns:
+        True if setup was successful.
+    """
+    hass.data.setdefault(DOMAIN, {})
+    await async_setup_services(hass)
+    return True
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: GoveeConfigEntry) -> bool:
     """Set up Govee from a config entry.
 
@@ -173,13 +199,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: GoveeConfigEntry) -> boo
     # Set up platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-    # Set up services (only once)
-    if not hass.data.get(DOMAIN):
-        hass.data[DOMAIN] = {}
-        await async_setup_services(hass)
-
     # Store coordinator in hass.data for services access
-    hass.data[DOMAIN][entry.entry_id] = coordinator
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
 
     # Register update listener for options changes
     entry.async_on_unload(entry.add_update_listener(_async_update_listener))
@@ -208,14 +229,19 @@ async def async_unload_entry(hass: HomeAssistant, entry: GoveeConfigEntry) -> bo
         # Remove from hass.data
         hass.data[DOMAIN].pop(entry.entry_id, None)
 
-        # Unload services if no more entries
-        if not hass.data[DOMAIN]:
-            await async_unload_services(hass)
-            hass.data.pop(DOMAIN, None)
-
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: GoveeConfigEntry) -> None:
+    """Remove data persisted for a deleted config entry.
+
+    Args:
+        hass: Home Assistant instance.
+        entry: Config entry being removed.
+    """
+    await async_remove_scene_store(hass, entry.entry_id)
+
+
 async def _async_cleanup_orphaned_entities(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -357,12 +357,15 @@ class GoveeAwsIotClient:
                 )
                 return
 
-            _LOGGER.debug(
-                "MQTT state update for %s: power=%s, brightness=%s",
-                device_id,
-                state.get("onOff"),
-                state.get("brightness"),
-            )
+            # Arguments are looked up eagerly, so skip them unless debugging;
+            # this runs for every push message
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "MQTT state update for %s: power=%s, brightness=%s",
+                    device_id,
+                    state.get("onOff"),
+                    state.get("brightness"),
+                )
 
             # Invoke callback with device ID and state dict
             self._on_state_update(device_id, state)
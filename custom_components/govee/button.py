@@ -17,7 +17,6 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .coordinator import GoveeCoordinator
 from .entity import GoveeEntity
-from .models import GoveeDevice
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -51,17 +50,8 @@ class GoveeRefreshScenesButton(GoveeEntity, ButtonEntity):
     _attr_entity_category = EntityCategory.CONFIG
     _attr_translation_key = "refresh_scenes"
     _attr_icon = "mdi:refresh"
-
-    def __init__(
-        self,
-        coordinator: GoveeCoordinator,
-        device: GoveeDevice,
-    ) -> None:
-        """Initialize the refresh scenes button."""
-        super().__init__(coordinator, device)
-
-        self._attr_unique_id = f"{device.device_id}_refresh_scenes"
-        self._attr_name = "Refresh Scenes"
+    _attr_name = "Refresh Scenes"
+    _id_suffix = "_refresh_scenes"
 
     async def async_press(self) -> None:
         """Handle the button press - refresh scenes."""
@@ -72,5 +62,7 @@ class GoveeRefreshScenesButton(GoveeEntity, ButtonEntity):
             self._device_id,
             refresh=True,
         )
+        # Let the scene select pick up the new list
+        self.coordinator.async_update_listeners()
 
         _LOGGER.info("Scenes refreshed for %s", self._device.name)
@@ -7,13 +7,16 @@ Implements IStateProvider protocol for clean architecture.
 from __future__ import annotations
 
 import asyncio
+import itertools
 import logging
+import time
 from datetime import timedelta
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .api import (
@@ -26,8 +29,31 @@ from .api import (
     GoveeRateLimitError,
 )
 from .api.auth import GoveeAuthClient
+from .api.ble_packet import (
+    DIY_STYLE_NAMES,
+    build_dreamview_packet,
+    build_music_mode_packet,
+    encode_packet_base64,
+)
 from .const import DOMAIN
-from .models import GoveeDevice, GoveeDeviceState
+from .models import (
+    BrightnessCommand,
+    ColorCommand,
+    ColorTempCommand,
+    DIYSceneCommand,
+    GoveeDevice,
+    GoveeDeviceState,
+    ModeCommand,
+    MusicModeCommand,
+    OscillationCommand,
+    PowerCommand,
+    RGBColor,
+    SceneCommand,
+    SegmentColorCommand,
+    ToggleCommand,
+    WorkModeCommand,
+)
+from .models.device import INSTANCE_DREAMVIEW, INSTANCE_HDMI_SOURCE
 from .protocols import IStateObserver
 from .repairs import (
     async_create_auth_issue,
@@ -46,6 +72,29 @@ _LOGGER = logging.getLogger(__name__)
 # State fetch timeout per device
 STATE_FETCH_TIMEOUT = 30
 
+# Minimum spacing between control commands sent to the same device (seconds)
+COMMAND_MIN_INTERVAL = 0.1
+
+# Window (seconds) in which optimistic updates from control commands are
+# collected into one listener notification
+CONTROL_UPDATE_WINDOW = 0.015
+
+# Persisted scene lists, served while fresh lists are fetched in the background
+SCENE_STORE_VERSION = 1
+SCENE_STORE_SAVE_DELAY = 10
+
+
+def _scene_store(
+    hass: HomeAssistant, entry_id: str
+) -> Store[dict[str, dict[str, list[dict[str, Any]]]]]:
+    """Return the scene list store for a config entry."""
+    return Store(hass, SCENE_STORE_VERSION, f"{DOMAIN}.{entry_id}.scenes")
+
+
+async def async_remove_scene_store(hass: HomeAssistant, entry_id: str) -> None:
+    """Remove persisted scene lists for a deleted config entry."""
+    await _scene_store(hass, entry_id).async_remove()
+
 
 class GoveeCoordinator(DataUpdateCoordinator[dict[str, GoveeDeviceState]]):
     """Coordinator for Govee device state management.
@@ -94,6 +143,10 @@ class GoveeCoordinator(DataUpdateCoordinator[dict[str, GoveeDeviceState]]):
         # Device registry
         self._devices: dict[str, GoveeDevice] = {}
 
+        # Devices partitioned by the light platform's entity types
+        self._light_devices: list[GoveeDevice] = []
+        self._segment_devices: list[GoveeDevice] = []
+
         # State cache
         self._states: dict[str, GoveeDeviceState] = {}
 
@@ -103,6 +156,10 @@ class GoveeCoordinator(DataUpdateCoordinator[dict[str, GoveeDeviceState]]):
         # DIY scene cache {device_id: [scenes]}
         self._diy_scene_cache: dict[str, list[dict[str, Any]]] = {}
 
+        # Scene lists persisted from the previous run {"scenes"|"diy_scenes": cache}
+        self._scene_store = _scene_store(hass, config_entry.entry_id)
+        self._stored_scenes: dict[str, dict[str, list[dict[str, Any]]]] = {}
+
         # Observers for state changes
         self._observers: list[IStateObserver] = []
 
@@ -116,11 +173,41 @@ class GoveeCoordinator(DataUpdateCoordinator[dict[str, GoveeDeviceState]]):
         # Track rate limit state to avoid spamming repair issues
         self._rate_limited: bool = False
 
+        # Segment color writes waiting to be coalesced
+        # Maps device_id -> {color: (segment indices, result future)}
+        self._pending_segment_colors: dict[
+            str, dict[RGBColor, tuple[list[int], asyncio.Future[bool]]]
+        ] = {}
+
+        # Per-device command serialization and last transmit time
+        self._command_locks: dict[str, asyncio.Lock] = {}
+        self._last_command_time: dict[str, float] = {}
+
+        # Token of the newest queued command per device and (capability type,
+        # instance); older commands for the same target are dropped before
+        # sending. Tokens rather than commands, since commands like POWER_ON
+        # are shared instances and identity can't tell two calls apart.
+        self._latest_commands: dict[str, dict[tuple[str, str], int]] = {}
+        self._command_tokens = itertools.count()
+
+        # Pending listener notification for optimistic command updates
+        self._control_update_handle: asyncio.TimerHandle | None = None
+
     @property
     def devices(self) -> dict[str, GoveeDevice]:
         """Get all discovered devices."""
         return self._devices
 
+    @property
+    def light_devices(self) -> list[GoveeDevice]:
+        """Get devices that get a light entity (power control, not fans)."""
+        return self._light_devices
+
+    @property
+    def segment_devices(self) -> list[GoveeDevice]:
+        """Get RGBIC devices with segment control."""
+        return self._segment_devices
+
     @property
     def mqtt_connected(self) -> bool:
         """Return True if MQTT client is connected."""
@@ -139,6 +226,17 @@ class GoveeCoordinator(DataUpdateCoordinator[dict[str, GoveeDeviceState]]):
         """Get current state for a device."""
         return self._states.get(device_id)
 
+    def has_pending_command(self, device_id: str, command: DeviceCommand) -> bool:
+        """Check if a command for the same target is queued or in flight.
+
+        The device state only reflects a command once it has been sent, so
+        callers deciding from state can use this to see what is still to come.
+        """
+        latest = self._latest_commands.get(device_id)
+        if not latest:
+            return False
+        return (command.capability_type, command.instance) in latest
+
     def register_observer(self, observer: IStateObserver) -> None:
         """Register a state change observer."""
         if observer not in self._observers:
@@ -162,6 +260,10 @@ class GoveeCoordinator(DataUpdateCoordinator[dict[str, GoveeDeviceState]]):
 
         Should be called once during integration setup.
         """
+        # Load scene lists from the last run so selects can show them while
+        # fresh lists are fetched in the background
+        self._stored_scenes = await self._scene_store.async_load() or {}
+
         # Discover devices
         await self._discover_devices()
 
@@ -215,50 +317,22 @@ class GoveeCoordinator(DataUpdateCoordinator[dict[str, GoveeDeviceState]]):
                     device.device_id
                 )
 
+            # Partition once so each platform setup doesn't rescan every device
+            self._light_devices = [
+                device
+                for device in self._devices.values()
+                if device.supports_power and not device.is_fan
+            ]
+            self._segment_devices = [
+                device for device in self._devices.values() if device.supports_segments
+            ]
+
             _LOGGER.info(
                 "Discovered %d Govee devices (enable_groups=%s)",
                 len(self._devices),
                 self._enable_groups,
             )
 
-            # Pre-populate scene cache for devices with scene capabilities
-            # This ensures scene entities are created on initial setup
-            _LOGGER.debug(
-                "Pre-populating scene cache for %d devices", len(self._devices)
-            )
-            for device_id, device in self._devices.items():
-                if device.supports_scenes:
-                    try:
-                        scenes = await self._api_client.get_dynamic_scenes(
-                            device_id, device.sku
-                        )
-                        self._scene_cache[device_id] = scenes
-                        _LOGGER.debug(
-                            "Cached %d scenes for %s", len(scenes), device.name
-                        )
-                    except GoveeApiError as err:
-                        _LOGGER.warning(
-                            "Failed to pre-fetch scenes for %s: %s", device.name, err
-                        )
-                        self._scene_cache[device_id] = []
-
-                if device.supports_diy_scenes:
-                    try:
-                        diy_scenes = await self._api_client.get_diy_scenes(
-                            device_id, device.sku
-                        )
-                        self._diy_scene_cache[device_id] = diy_scenes
-                        _LOGGER.debug(
-                            "Cached %d DIY scenes for %s", len(diy_scenes), device.name
-                        )
-                    except GoveeApiError as err:
-                        _LOGGER.warning(
-                            "Failed to pre-fetch DIY scenes for %s: %s",
-                            device.name,
-                            err,
-                        )
-                        self._diy_scene_cache[device_id] = []
-
             # Clear any auth issues on success
             await async_delete_auth_issue(self.hass, self._config_entry)
 
@@ -507,6 +581,12 @@ class GoveeCoordinator(DataUpdateCoordinator[dict[str, GoveeDeviceState]]):
     ) -> bool:
         """Send control command to device with optimistic update.
 
+        Commands to the same device are serialized and spaced at least
+        COMMAND_MIN_INTERVAL apart; different devices are not held up.
+        A queued command that is superseded by a newer one for the same
+        capability and instance is dropped (last write wins) and reports
+        success, since the newer command carries the intended state.
+
         Args:
             device_id: Device identifier.
             command: Command to execute.
@@ -519,17 +599,50 @@ class GoveeCoordinator(DataUpdateCoordinator[dict[str, GoveeDeviceState]]):
             _LOGGER.error("Unknown device: %s", device_id)
             return False
 
+        lock = self._command_locks.get(device_id)
+        if lock is None:
+            lock = self._command_locks[device_id] = asyncio.Lock()
+
+        # Segment commands address different segments under one instance and
+        # are already merged by async_control_segment_color
+        latest: dict[tuple[str, str], int] | None = None
+        key = (command.capability_type, command.instance)
+        token = next(self._command_tokens)
+        if not isinstance(command, SegmentColorCommand):
+            latest = self._latest_commands.setdefault(device_id, {})
+            latest[key] = token
+
         try:
-            success = await self._api_client.control_device(
-                device_id,
-                device.sku,
-                command,
-            )
+            async with lock:
+                # Only wait out whatever remains of the minimum gap since
+                # the previous command to this device
+                delay = (
+                    self._last_command_time.get(device_id, 0.0)
+                    + COMMAND_MIN_INTERVAL
+                    - time.monotonic()
+                )
+                if delay > 0:
+                    await asyncio.sleep(delay)
 
-            if success:
-                # Apply optimistic update
-                self._apply_optimistic_update(device_id, command)
-                self.async_set_updated_data(self._states)
+                if latest is not None and latest.get(key) != token:
+                    _LOGGER.debug(
+                        "Dropping superseded %s command for %s", key, device_id
+                    )
+                    return True
+
+                try:
+                    success = await self._api_client.control_device(
+                        device_id,
+                        device.sku,
+                        command,
+                    )
+                finally:
+                    self._last_command_time[device_id] = time.monotonic()
+
+            # Apply optimistic update; only notify listeners if state changed
+            # (segment colors are tracked by the segment entities themselves)
+            if success and self._apply_optimistic_update(device_id, command):
+                self._schedule_control_update()
 
             return success
 
@@ -538,6 +651,98 @@ class GoveeCoordinator(DataUpdateCoordinator[dict[str, GoveeDeviceState]]):
         except GoveeApiError as err:
             _LOGGER.error("Control command failed: %s", err)
             return False
+        finally:
+            # Clear the entry once this call is sent, dropped or cancelled,
+            # unless a newer call has taken it over
+            if latest is not None and latest.get(key) == token:
+                del latest[key]
+
+    def _schedule_control_update(self) -> None:
+        """Notify listeners once for commands completing close together.
+
+        A scene or group activation fans out into one command per entity,
+        and every listener rewrites its state on each notification. Commands
+        finishing within CONTROL_UPDATE_WINDOW share a single notification.
+        """
+        if self._control_update_handle is None:
+            self._control_update_handle = self.hass.loop.call_later(
+                CONTROL_UPDATE_WINDOW, self._flush_control_update
+            )
+
+    @callback
+    def _flush_control_update(self) -> None:
+        """Push optimistic command updates to listeners."""
+        self._control_update_handle = None
+        self.async_set_updated_data(self._states)
+
+    async def async_control_segment_color(
+        self,
+        device_id: str,
+        segment_index: int,
+        color: RGBColor,
+    ) -> bool:
+        """Set a segment color, coalescing with other segments of the device.
+
+        Each segment is its own entity, so a group or scene turn_on fires one
+        call per segment in the same event loop tick. The first caller yields
+        once to let those calls join, then sends a single SegmentColorCommand
+        per distinct color instead of one request per segment.
+
+        Args:
+            device_id: Device identifier.
+            segment_index: Zero-based segment index.
+            color: Target segment color.
+
+        Returns:
+            True if the command covering this segment succeeded.
+        """
+        loop = asyncio.get_running_loop()
+        pending = self._pending_segment_colors.get(device_id)
+
+        if pending is not None:
+            group = pending.get(color)
+            if group is None:
+                group = pending[color] = ([], loop.create_future())
+            group[0].append(segment_index)
+            # Shield so a cancelled joiner doesn't cancel the shared result
+            return await asyncio.shield(group[1])
+
+        future: asyncio.Future[bool] = loop.create_future()
+        pending = {color: ([segment_index], future)}
+        self._pending_segment_colors[device_id] = pending
+
+        try:
+            # Let segment calls scheduled in this tick join the batch
+            await asyncio.sleep(0)
+        except asyncio.CancelledError:
+            del self._pending_segment_colors[device_id]
+            for _, group_future in pending.values():
+                group_future.cancel()
+            raise
+        del self._pending_segment_colors[device_id]
+
+        try:
+            for group_color, (indices, group_future) in pending.items():
+                command = SegmentColorCommand(
+                    segment_indices=tuple(sorted(indices)),
+                    color=group_color,
+                )
+                try:
+                    success = await self.async_control_device(device_id, command)
+                except Exception as err:
+                    if not group_future.done():
+                        group_future.set_exception(err)
+                else:
+                    if not group_future.done():
+                        group_future.set_result(success)
+        finally:
+            # If the sending caller is cancelled mid-batch, release the
+            # segments that joined it rather than leaving them waiting
+            for _, group_future in pending.values():
+                if not group_future.done():
+                    group_future.cancel()
+
+        return await future
 
     async def async_send_music_mode(
         self, device_id: str, enabled: bool, sensitivity: int = 50
@@ -568,8 +773,6 @@ class GoveeCoordinator(DataUpdateCoordinator[dict[str, GoveeDeviceState]]):
             return False
 
         # Build and send BLE packet
-        from .api.ble_packet import build_music_mode_packet, encode_packet_base64
-
         packet = build_music_mode_packet(enabled, sensitivity)
         encoded = encode_packet_base64(packet)
 
@@ -625,8 +828,6 @@ class GoveeCoordinator(DataUpdateCoordinator[dict[str, GoveeDeviceState]]):
             _LOGGER.error("Unknown device for DreamView: %s", device_id)
             return False
 
-        from .api.ble_packet import build_dreamview_packet, encode_packet_base64
-
         packet = build_dreamview_packet(enabled)
         encoded = encode_packet_base64(packet)
 
@@ -676,8 +877,6 @@ class GoveeCoordinator(DataUpdateCoordinator[dict[str, GoveeDeviceState]]):
             _LOGGER.error("Unknown device for DIY style: %s", device_id)
             return False
 
-        from .api.ble_packet import DIY_STYLE_NAMES
-
         style_value = DIY_STYLE_NAMES.get(style)
         if style_value is None:
             _LOGGER.warning("Unknown DIY style: %s", style)
@@ -701,25 +900,15 @@ class GoveeCoordinator(DataUpdateCoordinator[dict[str, GoveeDeviceState]]):
         self,
         device_id: str,
         command: DeviceCommand,
-    ) -> None:
-        """Apply optimistic state update based on command."""
+    ) -> bool:
+        """Apply optimistic state update based on command.
+
+        Returns:
+            True if the device state was updated.
+        """
         state = self._states.get(device_id)
         if not state:
-            return
-
-        # Import here to avoid circular dependency
-        from .models.commands import (
-            BrightnessCommand,
-            ColorCommand,
-            ColorTempCommand,
-            DIYSceneCommand,
-            ModeCommand,
-            MusicModeCommand,
-            PowerCommand,
-            SceneCommand,
-            ToggleCommand,
-        )
-        from .models.device import INSTANCE_DREAMVIEW, INSTANCE_HDMI_SOURCE
+            return False
 
         if isinstance(command, PowerCommand):
             state.apply_optimistic_power(command.power_on)
@@ -733,9 +922,14 @@ class GoveeCoordinator(DataUpdateCoordinator[dict[str, GoveeDeviceState]]):
             state.apply_optimistic_scene(str(command.scene_id))
         elif isinstance(command, DIYSceneCommand):
             state.apply_optimistic_diy_scene(str(command.scene_id))
+        elif isinstance(command, OscillationCommand):
+            state.apply_optimistic_oscillation(command.oscillating)
+        elif isinstance(command, WorkModeCommand):
+            state.apply_optimistic_work_mode(command.work_mode, command.mode_value)
         elif isinstance(command, ModeCommand):
-            if command.mode_instance == INSTANCE_HDMI_SOURCE:
-                state.apply_optimistic_hdmi_source(command.value)
+            if command.mode_instance != INSTANCE_HDMI_SOURCE:
+                return False
+            state.apply_optimistic_hdmi_source(command.value)
         elif isinstance(command, MusicModeCommand):
             # Look up mode name from device capabilities for display
             device = self._devices.get(device_id)
@@ -752,8 +946,34 @@ class GoveeCoordinator(DataUpdateCoordinator[dict[str, GoveeDeviceState]]):
             )
         elif isinstance(command, ToggleCommand):
             # Handle toggle commands (DreamView, night light, etc)
-            if command.toggle_instance == INSTANCE_DREAMVIEW:
-                state.apply_optimistic_dreamview(command.enabled)
+            if command.toggle_instance != INSTANCE_DREAMVIEW:
+                return False
+            state.apply_optimistic_dreamview(command.enabled)
+        else:
+            return False
+
+        return True
+
+    def get_cached_scenes(self, device_id: str) -> list[dict[str, Any]]:
+        """Get scenes without fetching, falling back to the last run's list."""
+        cached = self._scene_cache.get(device_id)
+        if cached is not None:
+            return cached
+        return self._stored_scenes.get("scenes", {}).get(device_id, [])
+
+    def get_cached_diy_scenes(self, device_id: str) -> list[dict[str, Any]]:
+        """Get DIY scenes without fetching, falling back to the last run's list."""
+        cached = self._diy_scene_cache.get(device_id)
+        if cached is not None:
+            return cached
+        return self._stored_scenes.get("diy_scenes", {}).get(device_id, [])
+
+    def _schedule_scene_store_save(self) -> None:
+        """Persist fetched scene lists after a short delay."""
+        self._scene_store.async_delay_save(
+            lambda: {"scenes": self._scene_cache, "diy_scenes": self._diy_scene_cache},
+            SCENE_STORE_SAVE_DELAY,
+        )
 
     async def async_get_scenes(
         self,
@@ -794,6 +1014,7 @@ class GoveeCoordinator(DataUpdateCoordinator[dict[str, GoveeDeviceState]]):
         try:
             scenes = await self._api_client.get_dynamic_scenes(device_id, device.sku)
             self._scene_cache[device_id] = scenes
+            self._schedule_scene_store_save()
             _LOGGER.info(
                 "Fetched and cached %d scenes for %s",
                 len(scenes),
@@ -807,7 +1028,7 @@ class GoveeCoordinator(DataUpdateCoordinator[dict[str, GoveeDeviceState]]):
                 err,
             )
             # Return cached scenes if available, otherwise empty list
-            cached = self._scene_cache.get(device_id, [])
+            cached = self.get_cached_scenes(device_id)
             _LOGGER.debug("Returning %d cached scenes after error", len(cached))
             return cached
 
@@ -850,6 +1071,7 @@ class GoveeCoordinator(DataUpdateCoordinator[dict[str, GoveeDeviceState]]):
         try:
             scenes = await self._api_client.get_diy_scenes(device_id, device.sku)
             self._diy_scene_cache[device_id] = scenes
+            self._schedule_scene_store_save()
             _LOGGER.info(
                 "Fetched and cached %d DIY scenes for %s",
                 len(scenes),
@@ -863,12 +1085,37 @@ class GoveeCoordinator(DataUpdateCoordinator[dict[str, GoveeDeviceState]]):
                 err,
             )
             # Return cached scenes if available, otherwise empty list
-            cached = self._diy_scene_cache.get(device_id, [])
+            cached = self.get_cached_diy_scenes(device_id)
             _LOGGER.debug("Returning %d cached DIY scenes after error", len(cached))
             return cached
 
+    async def async_refresh_scene_lists(
+        self,
+        scene_device_ids: list[str],
+        diy_device_ids: list[str],
+    ) -> None:
+        """Refresh scene lists for the select entities in one pass.
+
+        Fetches run one after another so a setup with many devices stays
+        within the API rate limit, then listeners are notified once so the
+        selects pick up the new lists.
+
+        Args:
+            scene_device_ids: Devices with a scene select.
+            diy_device_ids: Devices with a DIY scene select.
+        """
+        for device_id in scene_device_ids:
+            await self.async_get_scenes(device_id, refresh=True)
+        for device_id in diy_device_ids:
+            await self.async_get_diy_scenes(device_id, refresh=True)
+        self.async_update_listeners()
+
     async def async_shutdown(self) -> None:
         """Shutdown coordinator and cleanup resources."""
+        if self._control_update_handle is not None:
+            self._control_update_handle.cancel()
+            self._control_update_handle = None
+
         if self._mqtt_client:
             await self._mqtt_client.async_stop()
             self._mqtt_client = None
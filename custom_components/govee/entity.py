@@ -8,8 +8,11 @@ Provides common functionality for all Govee entities:
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import re
+from functools import lru_cache
+from typing import TYPE_CHECKING, ClassVar
 
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -19,6 +22,53 @@ if TYPE_CHECKING:
     from .coordinator import GoveeCoordinator
     from .models import GoveeDevice, GoveeDeviceState
 
+# Common area keywords in priority order; when a name mentions several, the
+# earliest in this list wins
+_AREAS = (
+    "Living Room",
+    "Bedroom",
+    "Kitchen",
+    "Bathroom",
+    "Office",
+    "Dining Room",
+    "Garage",
+    "Basement",
+    "Attic",
+    "Hallway",
+    "Patio",
+    "Backyard",
+    "Front Yard",
+    "Game Room",
+    "Media Room",
+    "Nursery",
+    "Guest Room",
+    "Master Bedroom",
+    "Kids Room",
+)
+# Alternatives longest first so "Master Bedroom" is matched whole rather
+# than as "Bedroom"
+_AREA_RE = re.compile(
+    "|".join(map(re.escape, sorted(_AREAS, key=len, reverse=True))), re.IGNORECASE
+)
+_AREA_RANK = {area.lower(): rank for rank, area in enumerate(_AREAS)}
+
+
+@lru_cache(maxsize=512)
+def _infer_area_from_name(name: str) -> str | None:
+    """Infer area from device name.
+
+    Extracts common room names from device names like:
+    - "Living Room Lamp" -> "Living Room"
+    - "Bedroom LED Strip" -> "Bedroom"
+    - "Kitchen Lights" -> "Kitchen"
+
+    Returns None if no area can be inferred.
+    """
+    found = {match.group(0).lower() for match in _AREA_RE.finditer(name)}
+    if not found:
+        return None
+    return _AREAS[min(_AREA_RANK[area] for area in found)]
+
 
 class GoveeEntity(CoordinatorEntity["GoveeCoordinator"]):
     """Base class for Govee entities.
@@ -30,8 +80,13 @@ class GoveeEntity(CoordinatorEntity["GoveeCoordinator"]):
     - has_entity_name = True for Gold tier compliance
     """
 
+    __slots__ = ("_device", "_device_id", "_cached_state", "_always_available")
+
     _attr_has_entity_name = True
 
+    # Appended to the device ID for entities other than the device's main one
+    _id_suffix: ClassVar[str] = ""
+
     def __init__(
         self,
         coordinator: GoveeCoordinator,
@@ -47,21 +102,47 @@ class GoveeEntity(CoordinatorEntity["GoveeCoordinator"]):
         self._device = device
         self._device_id = device.device_id
 
-        # Set unique_id based on device
-        self._attr_unique_id = f"{device.device_id}"
+        # State object for this device, refreshed on each coordinator update
+        # so property reads within a cycle share one lookup
+        self._cached_state = coordinator.get_state(device.device_id)
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information for device registry."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._device.device_id)},
-            name=self._device.name,
+        # Group devices can't report state but can still be controlled
+        self._always_available = device.is_group
+
+        # Device IDs are already strings; with no suffix the concatenation
+        # returns the device's own value rather than a fresh copy
+        self._attr_unique_id = device.device_id + self._id_suffix
+
+        # Device identity never changes for the entity's lifetime
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, device.device_id)},
+            name=device.name,
             manufacturer="Govee",
-            model=self._device.sku,
+            model=device.sku,
             # Suggested area from device name (e.g., "Living Room Lamp" -> "Living Room")
-            suggested_area=self._infer_area_from_name(self._device.name),
+            suggested_area=_infer_area_from_name(device.name),
         )
 
+    async def async_added_to_hass(self) -> None:
+        """Pick up any state replaced between construction and registration."""
+        await super().async_added_to_hass()
+        self._cached_state = self.coordinator.get_state(self._device_id)
+        self._update_from_state()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh the cached state reference before writing state."""
+        self._cached_state = self.coordinator.get_state(self._device_id)
+        self._update_from_state()
+        super()._handle_coordinator_update()
+
+    def _update_from_state(self) -> None:
+        """Copy the cached device state into _attr_* fields.
+
+        Called whenever the cached state is refreshed; entities that expose
+        state through _attr_* fields instead of properties override this.
+        """
+
     @property
     def available(self) -> bool:
         """Return True if entity is available.
@@ -69,54 +150,10 @@ class GoveeEntity(CoordinatorEntity["GoveeCoordinator"]):
         Group devices are always considered available since we can't
         query their state but can still control them.
         """
-        if self._device.is_group:
-            return True
-
-        state = self.coordinator.get_state(self._device_id)
-        return state is not None and state.online
+        state = self._cached_state
+        return self._always_available or (state is not None and state.online)
 
     @property
     def device_state(self) -> GoveeDeviceState | None:
-        """Get current device state from coordinator."""
-        return self.coordinator.get_state(self._device_id)
-
-    @staticmethod
-    def _infer_area_from_name(name: str) -> str | None:
-        """Infer area from device name.
-
-        Extracts common room names from device names like:
-        - "Living Room Lamp" -> "Living Room"
-        - "Bedroom LED Strip" -> "Bedroom"
-        - "Kitchen Lights" -> "Kitchen"
-
-        Returns None if no area can be inferred.
-        """
-        # Common area keywords (check in order)
-        areas = [
-            "Living Room",
-            "Bedroom",
-            "Kitchen",
-            "Bathroom",
-            "Office",
-            "Dining Room",
-            "Garage",
-            "Basement",
-            "Attic",
-            "Hallway",
-            "Patio",
-            "Backyard",
-            "Front Yard",
-            "Game Room",
-            "Media Room",
-            "Nursery",
-            "Guest Room",
-            "Master Bedroom",
-            "Kids Room",
-        ]
-
-        name_lower = name.lower()
-        for area in areas:
-            if area.lower() in name_lower:
-                return area
-
-        return None
+        """Get current device state cached on the last coordinator update."""
+        return self._cached_state
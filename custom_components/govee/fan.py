@@ -10,34 +10,54 @@ Provides fan entities with support for:
 from __future__ import annotations
 
 import logging
-from typing import Any
+from typing import Any, Final
 
 from homeassistant.components.fan import FanEntity, FanEntityFeature
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.util.percentage import (
-    ordered_list_item_to_percentage,
-    percentage_to_ordered_list_item,
-)
 
 from .coordinator import GoveeCoordinator
 from .entity import GoveeEntity
-from .models import GoveeDevice, OscillationCommand, PowerCommand, WorkModeCommand
+from .models import (
+    POWER_OFF,
+    POWER_ON,
+    GoveeDevice,
+    OscillationCommand,
+    WorkModeCommand,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 # Fan speed names mapped to mode_value
 ORDERED_NAMED_FAN_SPEEDS = ["low", "medium", "high"]
 
+# mode_value (1/2/3) to percentage, matching HA's ordered list helpers
+_MODE_VALUE_TO_PERCENTAGE = {1: 33, 2: 66, 3: 100}
+
 # Preset modes: Normal uses gearMode (manual speed), Auto uses auto mode
-PRESET_MODE_NORMAL = "Normal"
-PRESET_MODE_AUTO = "Auto"
+PRESET_MODE_NORMAL: Final = "Normal"
+PRESET_MODE_AUTO: Final = "Auto"
 FAN_PRESET_MODES = [PRESET_MODE_NORMAL, PRESET_MODE_AUTO]
 
 # Work mode constants
-WORK_MODE_GEAR = 1  # Manual speed control
-WORK_MODE_AUTO = 3  # Automatic mode
+WORK_MODE_GEAR: Final = 1  # Manual speed control
+WORK_MODE_AUTO: Final = 3  # Automatic mode
+
+# Preset mode to (work_mode, mode_value); None keeps the current speed
+_PRESET_TO_WORK_MODE: Final[dict[str, tuple[int, int | None]]] = {
+    PRESET_MODE_AUTO: (WORK_MODE_AUTO, 0),  # mode_value not used in auto mode
+    PRESET_MODE_NORMAL: (WORK_MODE_GEAR, None),
+}
+
+
+def _percentage_to_mode_value(percentage: int) -> int:
+    """Map a percentage (1-100) to mode_value, as HA's ordered list helpers do."""
+    if percentage <= 33:
+        return 1
+    if percentage <= 66:
+        return 2
+    return 3
 
 
 async def async_setup_entry(
@@ -75,6 +95,8 @@ class GoveeFanEntity(GoveeEntity, FanEntity):
     - Preset modes (Normal, Auto)
     """
 
+    __slots__ = ()
+
     _attr_translation_key = "govee_fan"
     _attr_speed_count = len(ORDERED_NAMED_FAN_SPEEDS)
 
@@ -105,7 +127,7 @@ class GoveeFanEntity(GoveeEntity, FanEntity):
     @property
     def is_on(self) -> bool | None:
         """Return True if fan is on."""
-        state = self.device_state
+        state = self._cached_state
         return state.power_state if state else None
 
     @property
@@ -115,21 +137,18 @@ class GoveeFanEntity(GoveeEntity, FanEntity):
         Maps mode_value 1/2/3 to Low/Medium/High.
         Only applies when in gearMode (work_mode=1).
         """
-        state = self.device_state
+        state = self._cached_state
         if state is None:
             return None
 
         # Only return percentage when in manual gear mode
-        if state.work_mode == WORK_MODE_GEAR and state.mode_value is not None:
-            try:
-                speed_name = ORDERED_NAMED_FAN_SPEEDS[state.mode_value - 1]
-                return ordered_list_item_to_percentage(
-                    ORDERED_NAMED_FAN_SPEEDS, speed_name
-                )
-            except (IndexError, ValueError):
-                _LOGGER.debug("Unknown mode_value: %s", state.mode_value)
+        if state.work_mode != WORK_MODE_GEAR or state.mode_value is None:
+            return None
 
-        return None
+        percentage = _MODE_VALUE_TO_PERCENTAGE.get(state.mode_value)
+        if percentage is None:
+            _LOGGER.debug("Unknown mode_value: %s", state.mode_value)
+        return percentage
 
     @property
     def preset_mode(self) -> str | None:
@@ -139,7 +158,7 @@ class GoveeFanEntity(GoveeEntity, FanEntity):
         - 1 (gearMode) -> Normal
         - 3 (Auto) -> Auto
         """
-        state = self.device_state
+        state = self._cached_state
         if state is None or state.work_mode is None:
             return None
 
@@ -150,7 +169,7 @@ class GoveeFanEntity(GoveeEntity, FanEntity):
     @property
     def oscillating(self) -> bool | None:
         """Return the oscillation state."""
-        state = self.device_state
+        state = self._cached_state
         return state.oscillating if state else None
 
     async def async_turn_on(
@@ -169,14 +188,14 @@ class GoveeFanEntity(GoveeEntity, FanEntity):
         # Send power on command
         await self.coordinator.async_control_device(
             self._device_id,
-            PowerCommand(power_on=True),
+            POWER_ON,
         )
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the fan off."""
         await self.coordinator.async_control_device(
             self._device_id,
-            PowerCommand(power_on=False),
+            POWER_OFF,
         )
 
     async def async_set_percentage(self, percentage: int) -> None:
@@ -189,17 +208,12 @@ class GoveeFanEntity(GoveeEntity, FanEntity):
             await self.async_turn_off()
             return
 
-        # Convert percentage to speed name (low/medium/high)
-        speed_name = percentage_to_ordered_list_item(
-            ORDERED_NAMED_FAN_SPEEDS, percentage
-        )
-        # Convert to mode_value (1/2/3)
-        mode_value = ORDERED_NAMED_FAN_SPEEDS.index(speed_name) + 1
+        # Convert percentage to mode_value (1/2/3 = low/medium/high)
+        mode_value = _percentage_to_mode_value(percentage)
 
         _LOGGER.debug(
-            "Setting fan speed: percentage=%d, speed_name=%s, mode_value=%d",
+            "Setting fan speed: percentage=%d, mode_value=%d",
             percentage,
-            speed_name,
             mode_value,
         )
 
@@ -210,13 +224,12 @@ class GoveeFanEntity(GoveeEntity, FanEntity):
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set the preset mode."""
-        if preset_mode == PRESET_MODE_AUTO:
-            work_mode = WORK_MODE_AUTO
-            mode_value = 0  # Not used in auto mode
-        else:
+        work_mode, mode_value = _PRESET_TO_WORK_MODE.get(
+            preset_mode, _PRESET_TO_WORK_MODE[PRESET_MODE_NORMAL]
+        )
+        if mode_value is None:
             # Normal mode - use current speed or default to medium
-            work_mode = WORK_MODE_GEAR
-            state = self.device_state
+            state = self._cached_state
             mode_value = state.mode_value if state and state.mode_value else 2
 
         _LOGGER.debug(
@@ -10,7 +10,9 @@ Provides light entities with support for:
 from __future__ import annotations
 
 import logging
-from typing import Any
+from collections.abc import Callable, Coroutine
+from functools import partial
+from typing import Any, ClassVar
 
 from homeassistant.components.light import (  # type: ignore[attr-defined]
     ATTR_BRIGHTNESS,
@@ -29,11 +31,13 @@ from .const import CONF_ENABLE_SEGMENTS, DEFAULT_ENABLE_SEGMENTS
 from .coordinator import GoveeCoordinator
 from .entity import GoveeEntity
 from .models import (
+    POWER_OFF,
+    POWER_ON,
     BrightnessCommand,
     ColorCommand,
     ColorTempCommand,
+    DeviceCommand,
     GoveeDevice,
-    PowerCommand,
     RGBColor,
 )
 from .platforms.segment import GoveeSegmentEntity
@@ -43,6 +47,29 @@ _LOGGER = logging.getLogger(__name__)
 # Home Assistant brightness range
 HA_BRIGHTNESS_MAX = 255
 
+# Order in which async_turn_on applies attributes: color first, then brightness
+_TURN_ON_ORDER = (ATTR_RGB_COLOR, ATTR_COLOR_TEMP_KELVIN, ATTR_BRIGHTNESS)
+_TURN_ON_ATTRS = frozenset(_TURN_ON_ORDER)
+
+
+def _determine_color_modes(device: GoveeDevice) -> set[ColorMode]:
+    """Determine supported color modes from device capabilities."""
+    modes: set[ColorMode] = set()
+
+    if device.supports_rgb:
+        modes.add(ColorMode.RGB)
+
+    if device.supports_color_temp:
+        modes.add(ColorMode.COLOR_TEMP)
+
+    if not modes and device.supports_brightness:
+        modes.add(ColorMode.BRIGHTNESS)
+
+    if not modes:
+        modes.add(ColorMode.ONOFF)
+
+    return modes
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -57,33 +84,28 @@ async def async_setup_entry(
     # Check if segments are enabled
     enable_segments = entry.options.get(CONF_ENABLE_SEGMENTS, DEFAULT_ENABLE_SEGMENTS)
 
-    for device in coordinator.devices.values():
-        # Only create light entities for devices with power control (not fans)
-        if device.supports_power and not device.is_fan:
-            entities.append(GoveeLightEntity(coordinator, device))
-
-        # Create segment entities for RGBIC devices
-        _LOGGER.debug(
-            "Segment check for %s: enable_segments=%s, supports_segments=%s, segment_count=%d",
-            device.name,
-            enable_segments,
-            device.supports_segments,
-            device.segment_count,
-        )
-        if enable_segments and device.supports_segments and device.segment_count > 0:
+    # Only devices with power control get a light entity (not fans)
+    entities.extend(
+        GoveeLightEntity(coordinator, device) for device in coordinator.light_devices
+    )
+
+    # Create segment entities for RGBIC devices
+    if enable_segments:
+        for device in coordinator.segment_devices:
+            segment_count = device.segment_count
             _LOGGER.debug(
                 "Creating %d segment entities for %s",
-                device.segment_count,
+                segment_count,
                 device.name,
             )
-            for segment_index in range(device.segment_count):
-                entities.append(
-                    GoveeSegmentEntity(
-                        coordinator=coordinator,
-                        device=device,
-                        segment_index=segment_index,
-                    )
+            entities.extend(
+                GoveeSegmentEntity(
+                    coordinator=coordinator,
+                    device=device,
+                    segment_index=segment_index,
                 )
+                for segment_index in range(segment_count)
+            )
 
     async_add_entities(entities)
     _LOGGER.debug("Set up %d Govee light entities", len(entities))
@@ -100,6 +122,8 @@ class GoveeLightEntity(GoveeEntity, LightEntity, RestoreEntity):
     - State restoration for group devices
     """
 
+    __slots__ = ("_brightness_max", "_control")
+
     _attr_translation_key = "govee_light"
 
     def __init__(
@@ -113,46 +137,36 @@ class GoveeLightEntity(GoveeEntity, LightEntity, RestoreEntity):
         # Set name (uses has_entity_name = True)
         self._attr_name = None  # Use device name
 
-        # Determine supported color modes
-        self._attr_supported_color_modes = self._determine_color_modes()
-        self._attr_color_mode = self._get_current_color_mode()
-
-        # Get device brightness range
-        self._brightness_min, self._brightness_max = device.brightness_range
-
-        # Add effect support if device has scenes
-        if device.supports_scenes:
-            self._attr_supported_features = LightEntityFeature.EFFECT
-
-    def _determine_color_modes(self) -> set[ColorMode]:
-        """Determine supported color modes from device capabilities."""
-        modes: set[ColorMode] = set()
-
-        if self._device.supports_rgb:
-            modes.add(ColorMode.RGB)
-
-        if self._device.supports_color_temp:
-            modes.add(ColorMode.COLOR_TEMP)
-
-        if not modes and self._device.supports_brightness:
-            modes.add(ColorMode.BRIGHTNESS)
-
-        if not modes:
-            modes.add(ColorMode.ONOFF)
+        # Every command goes to this device, so bind the target once
+        self._control: Callable[[DeviceCommand], Coroutine[Any, Any, bool]] = partial(
+            coordinator.async_control_device, device.device_id
+        )
 
-        return modes
+        # Support flags and ranges are precomputed per device, so these are
+        # plain attribute reads rather than capability scans
+        self._attr_supported_color_modes = _determine_color_modes(device)
+        self._attr_color_mode = self._get_current_color_mode()
+        self._brightness_max = device.brightness_range[1]
+        temp_range = device.color_temp_range
+        self._attr_min_color_temp_kelvin = temp_range.min_kelvin if temp_range else 2000
+        self._attr_max_color_temp_kelvin = temp_range.max_kelvin if temp_range else 9000
+        # Effect support if the device has scenes
+        self._attr_supported_features = (
+            LightEntityFeature.EFFECT
+            if device.supports_scenes
+            else LightEntityFeature(0)
+        )
+        self._update_from_state()
 
     def _get_current_color_mode(self) -> ColorMode:
         """Get current color mode based on state."""
-        state = self.device_state
-        modes = self._attr_supported_color_modes or set()
+        state = self._cached_state
+        modes = self._attr_supported_color_modes or ()
 
-        if state and state.color_temp_kelvin is not None:
-            if ColorMode.COLOR_TEMP in modes:
+        if state is not None:
+            if state.color_temp_kelvin is not None and ColorMode.COLOR_TEMP in modes:
                 return ColorMode.COLOR_TEMP
-
-        if state and state.color is not None:
-            if ColorMode.RGB in modes:
+            if state.color is not None and ColorMode.RGB in modes:
                 return ColorMode.RGB
 
         if ColorMode.BRIGHTNESS in modes:
@@ -160,114 +174,118 @@ class GoveeLightEntity(GoveeEntity, LightEntity, RestoreEntity):
 
         return ColorMode.ONOFF
 
-    @property
-    def is_on(self) -> bool | None:
-        """Return True if light is on."""
-        state = self.device_state
-        return state.power_state if state else None
+    def _update_from_state(self) -> None:
+        """Copy the cached device state into the light's _attr_* fields.
 
-    @property
-    def brightness(self) -> int | None:
-        """Return brightness (0-255)."""
-        state = self.device_state
+        Home Assistant reads these as cached attributes when writing state,
+        instead of calling a property per attribute on every update.
+        """
+        state = self._cached_state
         if state is None:
-            return None
+            self._attr_is_on = None
+            self._attr_brightness = None
+            self._attr_rgb_color = None
+            self._attr_color_temp_kelvin = None
+            return
 
+        self._attr_is_on = state.power_state
         # Convert device brightness to HA scale
-        return self._device_to_ha_brightness(state.brightness)
-
-    @property
-    def rgb_color(self) -> tuple[int, int, int] | None:
-        """Return RGB color as (r, g, b) tuple."""
-        state = self.device_state
-        if state and state.color:
-            return state.color.as_tuple
-        return None
-
-    @property
-    def color_temp_kelvin(self) -> int | None:
-        """Return color temperature in Kelvin."""
-        state = self.device_state
-        return state.color_temp_kelvin if state else None
-
-    @property
-    def min_color_temp_kelvin(self) -> int:
-        """Return minimum color temperature in Kelvin."""
-        temp_range = self._device.color_temp_range
-        return temp_range.min_kelvin if temp_range else 2000
-
-    @property
-    def max_color_temp_kelvin(self) -> int:
-        """Return maximum color temperature in Kelvin."""
-        temp_range = self._device.color_temp_range
-        return temp_range.max_kelvin if temp_range else 9000
+        self._attr_brightness = self._device_to_ha_brightness(state.brightness)
+        self._attr_rgb_color = state.color.as_tuple if state.color else None
+        self._attr_color_temp_kelvin = state.color_temp_kelvin
 
     def _ha_to_device_brightness(self, ha_brightness: int) -> int:
-        """Convert HA brightness (0-255) to device range."""
-        return int(ha_brightness / HA_BRIGHTNESS_MAX * self._brightness_max)
+        """Convert HA brightness (1-255) to device range.
+
+        Truncates, but never below 1, so the dimmest HA setting doesn't
+        send 0 and leave the light dark.
+        """
+        return max(1, ha_brightness * self._brightness_max // HA_BRIGHTNESS_MAX)
 
     def _device_to_ha_brightness(self, device_brightness: int) -> int:
         """Convert device brightness to HA range (0-255)."""
-        return int(device_brightness / self._brightness_max * HA_BRIGHTNESS_MAX)
+        return device_brightness * HA_BRIGHTNESS_MAX // self._brightness_max
+
+    async def _async_set_rgb_color(self, rgb: tuple[int, int, int]) -> None:
+        """Send an RGB color command."""
+        r, g, b = rgb
+        color = RGBColor(r=r, g=g, b=b)
+        await self._control(ColorCommand(color=color))
+        self._attr_color_mode = ColorMode.RGB
+
+    async def _async_set_color_temp(self, kelvin: int) -> None:
+        """Send a color temperature command."""
+        await self._control(ColorTempCommand(kelvin=kelvin))
+        self._attr_color_mode = ColorMode.COLOR_TEMP
+
+    async def _async_set_brightness(self, ha_brightness: int) -> None:
+        """Send a brightness command scaled to the device range."""
+        device_brightness = self._ha_to_device_brightness(ha_brightness)
+        await self._control(BrightnessCommand(brightness=device_brightness))
+
+    # Handlers for async_turn_on, applied in _TURN_ON_ORDER
+    _TURN_ON_HANDLERS: ClassVar[
+        dict[str, Callable[[GoveeLightEntity, Any], Coroutine[Any, Any, None]]]
+    ] = {
+        ATTR_RGB_COLOR: _async_set_rgb_color,
+        ATTR_COLOR_TEMP_KELVIN: _async_set_color_temp,
+        ATTR_BRIGHTNESS: _async_set_brightness,
+    }
 
     async def async_turn_on(self, **kwargs: Any) -> None:
-        """Turn the light on with optional parameters."""
-        # Handle brightness
-        if ATTR_BRIGHTNESS in kwargs:
-            ha_brightness = kwargs[ATTR_BRIGHTNESS]
-            device_brightness = self._ha_to_device_brightness(ha_brightness)
-            await self.coordinator.async_control_device(
-                self._device_id,
-                BrightnessCommand(brightness=device_brightness),
-            )
-
-        # Handle RGB color
-        if ATTR_RGB_COLOR in kwargs:
-            r, g, b = kwargs[ATTR_RGB_COLOR]
-            color = RGBColor(r=r, g=g, b=b)
-            await self.coordinator.async_control_device(
-                self._device_id,
-                ColorCommand(color=color),
-            )
-            self._attr_color_mode = ColorMode.RGB
-
-        # Handle color temperature
-        if ATTR_COLOR_TEMP_KELVIN in kwargs:
-            kelvin = kwargs[ATTR_COLOR_TEMP_KELVIN]
-            await self.coordinator.async_control_device(
-                self._device_id,
-                ColorTempCommand(kelvin=kelvin),
-            )
-            self._attr_color_mode = ColorMode.COLOR_TEMP
-
-        # Always send power on
-        await self.coordinator.async_control_device(
-            self._device_id,
-            PowerCommand(power_on=True),
+        """Turn the light on with optional parameters.
+
+        Each attribute is a separate API request, and requests to one device
+        are sent one at a time, so the power command is skipped when the
+        light is already on and only attributes are being changed. Group
+        state is only restored, never polled, so groups always get it.
+        """
+        # A bare turn_on skips the attribute handlers entirely
+        if _TURN_ON_ATTRS.isdisjoint(kwargs):
+            await self._control(POWER_ON)
+            return
+
+        # Read the live state: _attr_is_on lags optimistic updates until the
+        # coordinator's next notification. The state only changes once a
+        # command is sent, so a queued turn_off (or on) makes it stale
+        state = self._cached_state
+        was_on = (
+            state is not None
+            and state.power_state
+            and not self._device.is_group
+            and not self.coordinator.has_pending_command(self._device_id, POWER_ON)
         )
+        handlers = self._TURN_ON_HANDLERS
+        for attr in _TURN_ON_ORDER:
+            if attr in kwargs:
+                await handlers[attr](self, kwargs[attr])
+
+        if not was_on:
+            await self._control(POWER_ON)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the light off."""
-        await self.coordinator.async_control_device(
-            self._device_id,
-            PowerCommand(power_on=False),
-        )
+        await self._control(POWER_OFF)
 
     async def async_added_to_hass(self) -> None:
         """Restore state for group devices."""
         await super().async_added_to_hass()
 
-        if self._device.is_group:
-            last_state = await self.async_get_last_state()
-            if last_state:
-                # Restore power state
-                state = self.device_state
-                if state:
-                    state.power_state = last_state.state == "on"
-
-                    # Restore brightness
-                    if last_state.attributes.get("brightness"):
-                        device_brightness = self._ha_to_device_brightness(
-                            last_state.attributes["brightness"]
-                        )
-                        state.brightness = device_brightness
+        # Only groups restore state; other devices are polled
+        state = self._cached_state
+        if not self._device.is_group or state is None:
+            return
+
+        last_state = await self.async_get_last_state()
+        if last_state is None:
+            return
+
+        # Restore power state
+        state.power_state = last_state.state == "on"
+
+        # Restore brightness
+        brightness = last_state.attributes.get("brightness")
+        if brightness:
+            state.brightness = self._ha_to_device_brightness(brightness)
+
+        self._update_from_state()
@@ -4,6 +4,8 @@ All models are frozen dataclasses for immutability.
 """
 
 from .commands import (
+    POWER_OFF,
+    POWER_ON,
     BrightnessCommand,
     ColorCommand,
     ColorTempCommand,
@@ -52,6 +54,8 @@ __all__ = [
     "WorkModeCommand",
     "ModeCommand",
     "MusicModeCommand",
+    "POWER_ON",
+    "POWER_OFF",
     "create_dreamview_command",
     "create_night_light_command",
 ]
@@ -36,7 +36,7 @@ from .device import (
 from .state import RGBColor
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DeviceCommand(ABC):
     """Base class for device commands.
 
@@ -74,7 +74,7 @@ class DeviceCommand(ABC):
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PowerCommand(DeviceCommand):
     """Command to turn device on or off."""
 
@@ -92,7 +92,12 @@ class PowerCommand(DeviceCommand):
         return 1 if self.power_on else 0
 
 
-@dataclass(frozen=True)
+# Commands are immutable, so the two power commands are shared instances
+POWER_ON = PowerCommand(power_on=True)
+POWER_OFF = PowerCommand(power_on=False)
+
+
+@dataclass(frozen=True, slots=True)
 class BrightnessCommand(DeviceCommand):
     """Command to set device brightness."""
 
@@ -110,7 +115,7 @@ class BrightnessCommand(DeviceCommand):
         return self.brightness
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ColorCommand(DeviceCommand):
     """Command to set device RGB color."""
 
@@ -129,7 +134,7 @@ class ColorCommand(DeviceCommand):
         return self.color.as_packed_int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ColorTempCommand(DeviceCommand):
     """Command to set device color temperature."""
 
@@ -147,7 +152,7 @@ class ColorTempCommand(DeviceCommand):
         return self.kelvin
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SceneCommand(DeviceCommand):
     """Command to activate a scene."""
 
@@ -169,7 +174,7 @@ class SceneCommand(DeviceCommand):
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DIYSceneCommand(DeviceCommand):
     """Command to activate a DIY scene."""
 
@@ -188,7 +193,7 @@ class DIYSceneCommand(DeviceCommand):
         return self.scene_id
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SegmentColorCommand(DeviceCommand):
     """Command to set color for specific segments."""
 
@@ -210,7 +215,7 @@ class SegmentColorCommand(DeviceCommand):
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ToggleCommand(DeviceCommand):
     """Command to toggle a feature (night light, gradual on, etc)."""
 
@@ -229,17 +234,29 @@ class ToggleCommand(DeviceCommand):
         return 1 if self.enabled else 0
 
 
+# Toggle commands are immutable, so each factory hands out one of two
+# shared instances indexed by the enabled flag (False -> 0, True -> 1)
+_NIGHT_LIGHT_COMMANDS = (
+    ToggleCommand(toggle_instance=INSTANCE_NIGHT_LIGHT, enabled=False),
+    ToggleCommand(toggle_instance=INSTANCE_NIGHT_LIGHT, enabled=True),
+)
+_DREAMVIEW_COMMANDS = (
+    ToggleCommand(toggle_instance=INSTANCE_DREAMVIEW, enabled=False),
+    ToggleCommand(toggle_instance=INSTANCE_DREAMVIEW, enabled=True),
+)
+
+
 def create_night_light_command(enabled: bool) -> ToggleCommand:
     """Create a command to toggle night light mode."""
-    return ToggleCommand(toggle_instance=INSTANCE_NIGHT_LIGHT, enabled=enabled)
+    return _NIGHT_LIGHT_COMMANDS[enabled]
 
 
 def create_dreamview_command(enabled: bool) -> ToggleCommand:
     """Create a command to toggle DreamView (Movie Mode)."""
-    return ToggleCommand(toggle_instance=INSTANCE_DREAMVIEW, enabled=enabled)
+    return _DREAMVIEW_COMMANDS[enabled]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OscillationCommand(DeviceCommand):
     """Command to toggle fan oscillation."""
 
@@ -257,7 +274,7 @@ class OscillationCommand(DeviceCommand):
         return 1 if self.oscillating else 0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WorkModeCommand(DeviceCommand):
     """Command to set fan work mode and speed.
 
@@ -287,7 +304,7 @@ class WorkModeCommand(DeviceCommand):
         return {"workMode": self.work_mode, "modeValue": self.mode_value}
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ModeCommand(DeviceCommand):
     """Command to set a mode value (e.g., HDMI source).
 
@@ -311,7 +328,7 @@ class ModeCommand(DeviceCommand):
         return self.value
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MusicModeCommand(DeviceCommand):
     """Command to set music mode with STRUCT payload.
 
@@ -6,29 +6,34 @@ Frozen dataclass for immutability - device properties don't change at runtime.
 from __future__ import annotations
 
 import logging
+import sys
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass, field
+from operator import attrgetter
 from typing import Any
 
 _LOGGER = logging.getLogger(__name__)
 
-# Capability type constants (from Govee API v2.0)
-CAPABILITY_ON_OFF = "devices.capabilities.on_off"
-CAPABILITY_RANGE = "devices.capabilities.range"
-CAPABILITY_COLOR_SETTING = "devices.capabilities.color_setting"
-CAPABILITY_SEGMENT_COLOR = "devices.capabilities.segment_color_setting"
-CAPABILITY_DYNAMIC_SCENE = "devices.capabilities.dynamic_scene"
-CAPABILITY_MUSIC_MODE = "devices.capabilities.music_setting"
-CAPABILITY_TOGGLE = "devices.capabilities.toggle"
-CAPABILITY_WORK_MODE = "devices.capabilities.work_mode"
-CAPABILITY_PROPERTY = "devices.capabilities.property"
-CAPABILITY_MODE = "devices.capabilities.mode"
+# Capability type constants (from Govee API v2.0). Dotted literals aren't
+# interned automatically; interning them (and the parsed API strings) lets
+# equality checks succeed on identity.
+CAPABILITY_ON_OFF = sys.intern("devices.capabilities.on_off")
+CAPABILITY_RANGE = sys.intern("devices.capabilities.range")
+CAPABILITY_COLOR_SETTING = sys.intern("devices.capabilities.color_setting")
+CAPABILITY_SEGMENT_COLOR = sys.intern("devices.capabilities.segment_color_setting")
+CAPABILITY_DYNAMIC_SCENE = sys.intern("devices.capabilities.dynamic_scene")
+CAPABILITY_MUSIC_MODE = sys.intern("devices.capabilities.music_setting")
+CAPABILITY_TOGGLE = sys.intern("devices.capabilities.toggle")
+CAPABILITY_WORK_MODE = sys.intern("devices.capabilities.work_mode")
+CAPABILITY_PROPERTY = sys.intern("devices.capabilities.property")
+CAPABILITY_MODE = sys.intern("devices.capabilities.mode")
 
 # Device type constants
-DEVICE_TYPE_LIGHT = "devices.types.light"
-DEVICE_TYPE_PLUG = "devices.types.socket"
-DEVICE_TYPE_HEATER = "devices.types.heater"
-DEVICE_TYPE_HUMIDIFIER = "devices.types.humidifier"
-DEVICE_TYPE_FAN = "devices.types.fan"
+DEVICE_TYPE_LIGHT = sys.intern("devices.types.light")
+DEVICE_TYPE_PLUG = sys.intern("devices.types.socket")
+DEVICE_TYPE_HEATER = sys.intern("devices.types.heater")
+DEVICE_TYPE_HUMIDIFIER = sys.intern("devices.types.humidifier")
+DEVICE_TYPE_FAN = sys.intern("devices.types.fan")
 
 # Instance constants
 INSTANCE_POWER = "powerSwitch"
@@ -48,7 +53,7 @@ INSTANCE_MUSIC_MODE = "musicMode"
 INSTANCE_DREAMVIEW = "dreamViewToggle"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ColorTempRange:
     """Color temperature range in Kelvin."""
 
@@ -57,8 +62,12 @@ class ColorTempRange:
 
     @classmethod
     def from_capability(cls, capability: dict[str, Any]) -> ColorTempRange | None:
+        """Parse from a capability dict."""
+        return cls.from_parameters(capability.get("parameters", {}))
+
+    @classmethod
+    def from_parameters(cls, params: Mapping[str, Any]) -> ColorTempRange | None:
         """Parse from capability parameters."""
-        params = capability.get("parameters", {})
         range_data = params.get("range", {})
         min_k = range_data.get("min")
         max_k = range_data.get("max")
@@ -67,7 +76,7 @@ class ColorTempRange:
         return None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SegmentCapability:
     """Segment control capability for RGBIC devices."""
 
@@ -75,6 +84,11 @@ class SegmentCapability:
 
     @classmethod
     def from_capability(cls, capability: dict[str, Any]) -> SegmentCapability | None:
+        """Parse from a capability dict."""
+        return cls.from_parameters(capability.get("parameters", {}))
+
+    @classmethod
+    def from_parameters(cls, params: Mapping[str, Any]) -> SegmentCapability | None:
         """Parse from capability parameters.
 
         The segment count can be found in different places:
@@ -82,8 +96,6 @@ class SegmentCapability:
         2. In fields[].elementRange.max + 1 (0-based index)
         3. In fields[].size.max (max array size)
         """
-        params = capability.get("parameters", {})
-
         # Try direct segmentCount parameter
         count = params.get("segmentCount", 0)
 
@@ -106,7 +118,16 @@ class SegmentCapability:
         return cls(segment_count=count) if count else None
 
 
-@dataclass(frozen=True)
+def _is_valid_capability(raw_cap: Any) -> bool:
+    """Check a raw API capability has string type and instance fields."""
+    return (
+        isinstance(raw_cap, dict)
+        and isinstance(raw_cap.get("type", ""), str)
+        and isinstance(raw_cap.get("instance", ""), str)
+    )
+
+
+@dataclass(frozen=True, slots=True)
 class GoveeCapability:
     """Represents a device capability from Govee API."""
 
@@ -227,7 +248,39 @@ class GoveeCapability:
         )
 
 
-@dataclass(frozen=True)
+# Capability support bits, computed once per device in GoveeDevice.__post_init__
+_SUPPORTS_POWER = 1 << 0
+_SUPPORTS_BRIGHTNESS = 1 << 1
+_SUPPORTS_RGB = 1 << 2
+_SUPPORTS_COLOR_TEMP = 1 << 3
+_SUPPORTS_SEGMENTS = 1 << 4
+_SUPPORTS_SCENES = 1 << 5
+_SUPPORTS_DIY_SCENES = 1 << 6
+_SUPPORTS_NIGHT_LIGHT = 1 << 7
+_SUPPORTS_MUSIC_SETTING = 1 << 8
+_SUPPORTS_OSCILLATION = 1 << 9
+_SUPPORTS_DREAMVIEW = 1 << 10
+_SUPPORTS_WORK_MODE = 1 << 11
+_SUPPORTS_HDMI_SOURCE = 1 << 12
+
+_CAPABILITY_FLAGS: tuple[tuple[int, Callable[[GoveeCapability], bool]], ...] = (
+    (_SUPPORTS_POWER, attrgetter("is_power")),
+    (_SUPPORTS_BRIGHTNESS, attrgetter("is_brightness")),
+    (_SUPPORTS_RGB, attrgetter("is_color_rgb")),
+    (_SUPPORTS_COLOR_TEMP, attrgetter("is_color_temp")),
+    (_SUPPORTS_SEGMENTS, attrgetter("is_segment_color")),
+    (_SUPPORTS_SCENES, attrgetter("is_scene")),
+    (_SUPPORTS_DIY_SCENES, attrgetter("is_diy_scene")),
+    (_SUPPORTS_NIGHT_LIGHT, attrgetter("is_night_light")),
+    (_SUPPORTS_MUSIC_SETTING, lambda cap: cap.type == CAPABILITY_MUSIC_MODE),
+    (_SUPPORTS_OSCILLATION, attrgetter("is_oscillation")),
+    (_SUPPORTS_DREAMVIEW, attrgetter("is_dreamview")),
+    (_SUPPORTS_WORK_MODE, attrgetter("is_work_mode")),
+    (_SUPPORTS_HDMI_SOURCE, attrgetter("is_hdmi_source")),
+)
+
+
+@dataclass(frozen=True, slots=True)
 class GoveeDevice:
     """Represents a Govee device with its static properties.
 
@@ -240,46 +293,87 @@ class GoveeDevice:
     device_type: str
     capabilities: tuple[GoveeCapability, ...] = field(default_factory=tuple)
     is_group: bool = False
+    _support_flags: int = field(default=0, init=False, repr=False, compare=False)
+    _capability_index: dict[tuple[str, str], GoveeCapability] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _brightness_range: tuple[int, int] = field(
+        default=(0, 100), init=False, repr=False, compare=False
+    )
+    _color_temp_range: ColorTempRange | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _segment_count: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Index and parse capabilities once so lookups don't rescan them."""
+        flags = 0
+        index: dict[tuple[str, str], GoveeCapability] = {}
+        for cap in self.capabilities:
+            for flag, matches in _CAPABILITY_FLAGS:
+                if matches(cap):
+                    flags |= flag
+            # First capability wins, as with a linear scan
+            index.setdefault((cap.type, cap.instance), cap)
+        object.__setattr__(self, "_support_flags", flags)
+        object.__setattr__(self, "_capability_index", index)
+
+        # Parse capability parameters for the range helpers up front
+        for cap in self.capabilities:
+            if cap.is_brightness:
+                object.__setattr__(self, "_brightness_range", cap.brightness_range)
+                break
+        for cap in self.capabilities:
+            if cap.is_color_temp:
+                temp_range = ColorTempRange.from_parameters(cap.parameters)
+                object.__setattr__(self, "_color_temp_range", temp_range)
+                break
+        for cap in self.capabilities:
+            if cap.is_segment_color:
+                seg = SegmentCapability.from_parameters(cap.parameters)
+                if seg:
+                    object.__setattr__(self, "_segment_count", seg.segment_count)
+                break
 
     @property
     def supports_power(self) -> bool:
         """Check if device supports on/off control."""
-        return any(cap.is_power for cap in self.capabilities)
+        return bool(self._support_flags & _SUPPORTS_POWER)
 
     @property
     def supports_brightness(self) -> bool:
         """Check if device supports brightness control."""
-        return any(cap.is_brightness for cap in self.capabilities)
+        return bool(self._support_flags & _SUPPORTS_BRIGHTNESS)
 
     @property
     def supports_rgb(self) -> bool:
         """Check if device supports RGB color."""
-        return any(cap.is_color_rgb for cap in self.capabilities)
+        return bool(self._support_flags & _SUPPORTS_RGB)
 
     @property
     def supports_color_temp(self) -> bool:
         """Check if device supports color temperature."""
-        return any(cap.is_color_temp for cap in self.capabilities)
+        return bool(self._support_flags & _SUPPORTS_COLOR_TEMP)
 
     @property
     def supports_segments(self) -> bool:
         """Check if device supports segment control (RGBIC)."""
-        return any(cap.is_segment_color for cap in self.capabilities)
+        return bool(self._support_flags & _SUPPORTS_SEGMENTS)
 
     @property
     def supports_scenes(self) -> bool:
         """Check if device supports dynamic scenes."""
-        return any(cap.is_scene for cap in self.capabilities)
+        return bool(self._support_flags & _SUPPORTS_SCENES)
 
     @property
     def supports_diy_scenes(self) -> bool:
         """Check if device supports DIY scenes."""
-        return any(cap.is_diy_scene for cap in self.capabilities)
+        return bool(self._support_flags & _SUPPORTS_DIY_SCENES)
 
     @property
     def supports_night_light(self) -> bool:
         """Check if device supports night light toggle."""
-        return any(cap.is_night_light for cap in self.capabilities)
+        return bool(self._support_flags & _SUPPORTS_NIGHT_LIGHT)
 
     @property
     def supports_music_mode(self) -> bool:
@@ -289,9 +383,8 @@ class GoveeDevice:
         - Music setting capability (devices.capabilities.music_setting)
         - DIY scene support (which includes music reactive options)
         """
-        return (
-            any(cap.type == CAPABILITY_MUSIC_MODE for cap in self.capabilities)
-            or self.supports_diy_scenes
+        return bool(
+            self._support_flags & (_SUPPORTS_MUSIC_SETTING | _SUPPORTS_DIY_SCENES)
         )
 
     @property
@@ -307,30 +400,30 @@ class GoveeDevice:
     @property
     def supports_oscillation(self) -> bool:
         """Check if device supports oscillation (fans)."""
-        return any(cap.is_oscillation for cap in self.capabilities)
+        return bool(self._support_flags & _SUPPORTS_OSCILLATION)
 
     @property
     def supports_dreamview(self) -> bool:
         """Check if device supports DreamView (Movie Mode) toggle."""
-        return any(cap.is_dreamview for cap in self.capabilities)
+        return bool(self._support_flags & _SUPPORTS_DREAMVIEW)
 
     @property
     def supports_work_mode(self) -> bool:
         """Check if device supports work mode (fans)."""
-        return any(cap.is_work_mode for cap in self.capabilities)
+        return bool(self._support_flags & _SUPPORTS_WORK_MODE)
 
     @property
     def supports_hdmi_source(self) -> bool:
         """Check if device supports HDMI source selection."""
-        return any(cap.is_hdmi_source for cap in self.capabilities)
+        return bool(self._support_flags & _SUPPORTS_HDMI_SOURCE)
 
     def get_hdmi_source_options(self) -> list[dict[str, Any]]:
         """Get available HDMI source options from capability parameters."""
-        for cap in self.capabilities:
-            if cap.is_hdmi_source:
-                options: list[dict[str, Any]] = cap.parameters.get("options", [])
-                return options
-        return []
+        cap = self.get_capability(CAPABILITY_MODE, INSTANCE_HDMI_SOURCE)
+        if cap is None:
+            return []
+        options: list[dict[str, Any]] = cap.parameters.get("options", [])
+        return options
 
     @property
     def has_struct_music_mode(self) -> bool:
@@ -340,14 +433,9 @@ class GoveeDevice:
         containing musicMode, sensitivity, and optionally autoColor/rgb fields.
         Legacy devices use BLE passthrough via MQTT.
         """
-        for cap in self.capabilities:
-            if (
-                cap.type == CAPABILITY_MUSIC_MODE
-                and cap.instance == INSTANCE_MUSIC_MODE
-            ):
-                # STRUCT capabilities have 'fields' array in parameters
-                return "fields" in cap.parameters
-        return False
+        cap = self.get_capability(CAPABILITY_MUSIC_MODE, INSTANCE_MUSIC_MODE)
+        # STRUCT capabilities have 'fields' array in parameters
+        return cap is not None and "fields" in cap.parameters
 
     def get_music_mode_options(self) -> list[dict[str, Any]]:
         """Extract music mode options from capability fields.
@@ -355,15 +443,12 @@ class GoveeDevice:
         Returns list of {"name": "Rhythm", "value": 1} dicts.
         Pattern validated in external repositories.
         """
-        for cap in self.capabilities:
-            if (
-                cap.type == CAPABILITY_MUSIC_MODE
-                and cap.instance == INSTANCE_MUSIC_MODE
-            ):
-                for f in cap.parameters.get("fields", []):
-                    if f.get("fieldName") == "musicMode":
-                        options: list[dict[str, Any]] = f.get("options", [])
-                        return options
+        cap = self.get_capability(CAPABILITY_MUSIC_MODE, INSTANCE_MUSIC_MODE)
+        if cap is not None:
+            for f in cap.parameters.get("fields", []):
+                if f.get("fieldName") == "musicMode":
+                    options: list[dict[str, Any]] = f.get("options", [])
+                    return options
         return []
 
     def get_music_sensitivity_range(self) -> tuple[int, int]:
@@ -371,59 +456,42 @@ class GoveeDevice:
 
         Returns (min, max) tuple, defaulting to (0, 100).
         """
-        for cap in self.capabilities:
-            if (
-                cap.type == CAPABILITY_MUSIC_MODE
-                and cap.instance == INSTANCE_MUSIC_MODE
-            ):
-                for f in cap.parameters.get("fields", []):
-                    if f.get("fieldName") == "sensitivity":
-                        range_info = f.get("range", {})
-                        return (range_info.get("min", 0), range_info.get("max", 100))
+        cap = self.get_capability(CAPABILITY_MUSIC_MODE, INSTANCE_MUSIC_MODE)
+        if cap is not None:
+            for f in cap.parameters.get("fields", []):
+                if f.get("fieldName") == "sensitivity":
+                    range_info = f.get("range", {})
+                    return (range_info.get("min", 0), range_info.get("max", 100))
         return (0, 100)
 
     @property
     def is_light_device(self) -> bool:
         """Check if device is a light (not a plug, fan, or other appliance)."""
-        if self.is_fan or self.is_plug:
+        device_type = self.device_type
+        if device_type == DEVICE_TYPE_FAN or device_type == DEVICE_TYPE_PLUG:
             return False
-        return (
-            self.device_type == DEVICE_TYPE_LIGHT
-            or self.supports_rgb
-            or self.supports_color_temp
+        return device_type == DEVICE_TYPE_LIGHT or bool(
+            self._support_flags & (_SUPPORTS_RGB | _SUPPORTS_COLOR_TEMP)
         )
 
     @property
     def brightness_range(self) -> tuple[int, int]:
         """Get brightness range from capability. Default (0, 100)."""
-        for cap in self.capabilities:
-            if cap.is_brightness:
-                return cap.brightness_range
-        return (0, 100)
+        return self._brightness_range
 
     @property
     def color_temp_range(self) -> ColorTempRange | None:
         """Get color temperature range if supported."""
-        for cap in self.capabilities:
-            if cap.is_color_temp:
-                return ColorTempRange.from_capability({"parameters": cap.parameters})
-        return None
+        return self._color_temp_range
 
     @property
     def segment_count(self) -> int:
         """Get number of segments for RGBIC devices."""
-        for cap in self.capabilities:
-            if cap.is_segment_color:
-                seg = SegmentCapability.from_capability({"parameters": cap.parameters})
-                return seg.segment_count if seg else 0
-        return 0
+        return self._segment_count
 
     def get_capability(self, cap_type: str, instance: str) -> GoveeCapability | None:
         """Get a specific capability by type and instance."""
-        for cap in self.capabilities:
-            if cap.type == cap_type and cap.instance == instance:
-                return cap
-        return None
+        return self._capability_index.get((cap_type, instance))
 
     @classmethod
     def from_api_response(cls, data: dict[str, Any]) -> GoveeDevice:
@@ -438,7 +506,14 @@ class GoveeDevice:
         device_id = data.get("device", "")
         sku = data.get("sku", "")
         name = data.get("deviceName", sku)
-        device_type = data.get("type", "devices.types.light")
+        # A null or non-string type can't be interned; treat it as a light
+        # rather than failing discovery
+        raw_type = data.get("type")
+        device_type = (
+            sys.intern(raw_type)
+            if isinstance(raw_type, str) and raw_type
+            else DEVICE_TYPE_LIGHT
+        )
 
         # Check for group device types
         # Groups can be identified by:
@@ -450,22 +525,26 @@ class GoveeDevice:
             "devices.types.scenic_group",
         ) or (device_id.isdigit())
 
-        # Parse capabilities
-        raw_caps = data.get("capabilities", [])
-        capabilities = []
-        for raw_cap in raw_caps:
-            cap = GoveeCapability(
-                type=raw_cap.get("type", ""),
-                instance=raw_cap.get("instance", ""),
-                parameters=raw_cap.get("parameters", {}),
+        # Parse capabilities. Type and instance come from a small closed set
+        # shared by all devices; interning lets compares against constants
+        # hit identity. Malformed entries are skipped so one bad capability
+        # doesn't hide the whole device
+        intern = sys.intern
+        capabilities = tuple(
+            GoveeCapability(
+                type=intern(raw_cap.get("type", "")),
+                instance=intern(raw_cap.get("instance", "")),
+                parameters=raw_cap.get("parameters") or {},
             )
-            capabilities.append(cap)
+            for raw_cap in data.get("capabilities", [])
+            if _is_valid_capability(raw_cap)
+        )
 
         return cls(
             device_id=device_id,
             sku=sku,
             name=name,
             device_type=device_type,
-            capabilities=tuple(capabilities),
+            capabilities=capabilities,
             is_group=is_group,
         )
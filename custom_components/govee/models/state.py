@@ -5,11 +5,13 @@ Mutable state that changes with device updates from API or MQTT.
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RGBColor:
     """Immutable RGB color representation."""
 
@@ -31,16 +33,17 @@ class RGBColor:
 
     @property
     def as_packed_int(self) -> int:
-        """Return as packed integer for Govee API: (R << 16) + (G << 8) + B."""
-        return (self.r << 16) + (self.g << 8) + self.b
+        """Return as packed integer for Govee API: (R << 16) | (G << 8) | B."""
+        # Channels are clamped to 0-255, so OR-ing the shifted bytes is exact
+        return (self.r << 16) | (self.g << 8) | self.b
 
     @classmethod
     def from_packed_int(cls, value: int) -> RGBColor:
-        """Create from Govee API packed integer."""
-        r = (value >> 16) & 0xFF
-        g = (value >> 8) & 0xFF
-        b = value & 0xFF
-        return cls(r=r, g=g, b=b)
+        """Create from Govee API packed integer.
+
+        Colors are immutable, so instances are shared per packed value.
+        """
+        return _rgb_from_packed(value)
 
     @classmethod
     def from_dict(cls, data: dict[str, int]) -> RGBColor:
@@ -52,7 +55,13 @@ class RGBColor:
         )
 
 
-@dataclass(frozen=True)
+@lru_cache(maxsize=1024)
+def _rgb_from_packed(value: int) -> RGBColor:
+    """Unpack a Govee API packed integer, reusing colors seen before."""
+    return RGBColor(r=(value >> 16) & 0xFF, g=(value >> 8) & 0xFF, b=value & 0xFF)
+
+
+@dataclass(frozen=True, slots=True)
 class SegmentState:
     """State of a single segment in RGBIC device."""
 
@@ -68,7 +77,7 @@ class SegmentState:
         return cls(index=index, color=color, brightness=brightness)
 
 
-@dataclass
+@dataclass(slots=True)
 class GoveeDeviceState:
     """Mutable device state updated from API or MQTT.
 
@@ -121,44 +130,15 @@ class GoveeDeviceState:
         capabilities = data.get("capabilities", [])
         for cap in capabilities:
             cap_type = cap.get("type", "")
-            instance = cap.get("instance", "")
-            state = cap.get("state", {})
-            value = state.get("value")
+            value = cap.get("state", {}).get("value")
 
             if cap_type == "devices.capabilities.online":
                 self.online = bool(value)
+                continue
 
-            elif cap_type == "devices.capabilities.on_off":
-                if instance == "powerSwitch":
-                    self.power_state = bool(value)
-
-            elif cap_type == "devices.capabilities.range":
-                if instance == "brightness":
-                    self.brightness = int(value) if value is not None else 100
-
-            elif cap_type == "devices.capabilities.color_setting":
-                if instance == "colorRgb":
-                    if isinstance(value, int):
-                        self.color = RGBColor.from_packed_int(value)
-                    elif isinstance(value, dict):
-                        self.color = RGBColor.from_dict(value)
-                elif instance == "colorTemperatureK":
-                    self.color_temp_kelvin = int(value) if value is not None else None
-
-            elif cap_type == "devices.capabilities.toggle":
-                if instance == "oscillationToggle":
-                    self.oscillating = bool(value)
-                elif instance == "dreamViewToggle":
-                    self.dreamview_enabled = bool(value)
-
-            elif cap_type == "devices.capabilities.work_mode":
-                if instance == "workMode" and isinstance(value, dict):
-                    self.work_mode = value.get("workMode")
-                    self.mode_value = value.get("modeValue")
-
-            elif cap_type == "devices.capabilities.mode":
-                if instance == "hdmiSource":
-                    self.hdmi_source = int(value) if value is not None else None
+            parser = _STATE_PARSERS.get((cap_type, cap.get("instance", "")))
+            if parser is not None:
+                parser(self, value)
 
     def update_from_mqtt(self, data: dict[str, Any]) -> None:
         """Update state from MQTT push message.
@@ -212,6 +192,17 @@ class GoveeDeviceState:
         self.color = None  # Color temp mode
         self.source = "optimistic"
 
+    def _clear_music_mode(self) -> None:
+        """Clear music mode when a mutually exclusive mode is activated."""
+        self.music_mode_enabled = False
+        self.music_mode_value = None
+        self.music_mode_name = None
+
+    def _clear_scenes(self) -> None:
+        """Clear regular and DIY scenes when an exclusive mode is activated."""
+        self.active_scene = None
+        self.active_diy_scene = None
+
     def apply_optimistic_scene(self, scene_id: str) -> None:
         """Apply optimistic scene activation.
 
@@ -222,9 +213,7 @@ class GoveeDeviceState:
         self.source = "optimistic"
         # Mutual exclusion: clear other modes when activating scene
         self.dreamview_enabled = False
-        self.music_mode_enabled = False
-        self.music_mode_value = None
-        self.music_mode_name = None
+        self._clear_music_mode()
         self.active_diy_scene = None
 
     def apply_optimistic_diy_scene(self, scene_id: str) -> None:
@@ -237,9 +226,7 @@ class GoveeDeviceState:
         self.source = "optimistic"
         # Mutual exclusion: clear other modes when activating DIY scene
         self.dreamview_enabled = False
-        self.music_mode_enabled = False
-        self.music_mode_value = None
-        self.music_mode_name = None
+        self._clear_music_mode()
         self.active_scene = None
 
     def apply_optimistic_diy_style(
@@ -266,8 +253,7 @@ class GoveeDeviceState:
         # Mutual exclusion: clear other modes when enabling music mode
         if enabled:
             self.dreamview_enabled = False
-            self.active_scene = None
-            self.active_diy_scene = None
+            self._clear_scenes()
 
     def apply_optimistic_music_mode_struct(
         self,
@@ -292,8 +278,7 @@ class GoveeDeviceState:
         self.source = "optimistic"
         # Mutual exclusion: clear other modes when enabling music mode
         self.dreamview_enabled = False
-        self.active_scene = None
-        self.active_diy_scene = None
+        self._clear_scenes()
 
     def apply_optimistic_oscillation(self, oscillating: bool) -> None:
         """Apply optimistic oscillation update (fans)."""
@@ -321,13 +306,60 @@ class GoveeDeviceState:
         self.source = "optimistic"
         # Mutual exclusion: clear other modes when enabling DreamView
         if enabled:
-            self.music_mode_enabled = False
-            self.music_mode_value = None
-            self.music_mode_name = None
-            self.active_scene = None
-            self.active_diy_scene = None
+            self._clear_music_mode()
+            self._clear_scenes()
 
     @classmethod
     def create_empty(cls, device_id: str) -> GoveeDeviceState:
         """Create empty state for a device."""
         return cls(device_id=device_id)
+
+
+def _parse_power(state: GoveeDeviceState, value: Any) -> None:
+    state.power_state = bool(value)
+
+
+def _parse_brightness(state: GoveeDeviceState, value: Any) -> None:
+    state.brightness = int(value) if value is not None else 100
+
+
+def _parse_color_rgb(state: GoveeDeviceState, value: Any) -> None:
+    if isinstance(value, int):
+        state.color = RGBColor.from_packed_int(value)
+    elif isinstance(value, dict):
+        state.color = RGBColor.from_dict(value)
+
+
+def _parse_color_temp(state: GoveeDeviceState, value: Any) -> None:
+    state.color_temp_kelvin = int(value) if value is not None else None
+
+
+def _parse_oscillation(state: GoveeDeviceState, value: Any) -> None:
+    state.oscillating = bool(value)
+
+
+def _parse_dreamview(state: GoveeDeviceState, value: Any) -> None:
+    state.dreamview_enabled = bool(value)
+
+
+def _parse_work_mode(state: GoveeDeviceState, value: Any) -> None:
+    if isinstance(value, dict):
+        state.work_mode = value.get("workMode")
+        state.mode_value = value.get("modeValue")
+
+
+def _parse_hdmi_source(state: GoveeDeviceState, value: Any) -> None:
+    state.hdmi_source = int(value) if value is not None else None
+
+
+# REST state parsers keyed by (capability type, instance)
+_STATE_PARSERS: dict[tuple[str, str], Callable[[GoveeDeviceState, Any], None]] = {
+    ("devices.capabilities.on_off", "powerSwitch"): _parse_power,
+    ("devices.capabilities.range", "brightness"): _parse_brightness,
+    ("devices.capabilities.color_setting", "colorRgb"): _parse_color_rgb,
+    ("devices.capabilities.color_setting", "colorTemperatureK"): _parse_color_temp,
+    ("devices.capabilities.toggle", "oscillationToggle"): _parse_oscillation,
+    ("devices.capabilities.toggle", "dreamViewToggle"): _parse_dreamview,
+    ("devices.capabilities.work_mode", "workMode"): _parse_work_mode,
+    ("devices.capabilities.mode", "hdmiSource"): _parse_hdmi_source,
+}
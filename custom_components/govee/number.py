@@ -114,7 +114,7 @@ class GoveeMusicSensitivityNumber(
     def device_info(self) -> DeviceInfo:
         """Return device information."""
         return DeviceInfo(
-            identifiers={(DOMAIN, self._device.device_id)},
+            identifiers={(DOMAIN, self._device_id)},
             name=self._device.name,
             manufacturer="Govee",
             model=self._device.sku,
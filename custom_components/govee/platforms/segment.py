@@ -7,6 +7,7 @@ following the WLED pattern for segment control.
 from __future__ import annotations
 
 import logging
+import time
 from typing import Any
 
 from homeassistant.components.light import (  # type: ignore[attr-defined]
@@ -23,10 +24,29 @@ from homeassistant.helpers.restore_state import RestoreEntity
 
 from ..const import CONF_ENABLE_SEGMENTS, DEFAULT_ENABLE_SEGMENTS, DOMAIN
 from ..coordinator import GoveeCoordinator
-from ..models import GoveeDevice, RGBColor, SegmentColorCommand
+from ..models import GoveeDevice, RGBColor
 
 _LOGGER = logging.getLogger(__name__)
 
+# Color sent to turn a segment off
+SEGMENT_OFF_COLOR = RGBColor(r=0, g=0, b=0)
+
+# Color used when turning on a segment whose stored color is black
+SEGMENT_DEFAULT_RGB = (255, 255, 255)
+
+# Identical turn_on calls repeated within this window (seconds) are not resent
+SEGMENT_REPEAT_WINDOW = 0.1
+
+# Q8 fixed-point scale factor per HA brightness (0-255); 255 maps to 256 (1.0)
+_Q8_SCALE = tuple(round(b * 256 / 255) for b in range(256))
+
+
+def _scale_color(rgb_color: tuple[int, int, int], brightness: int) -> RGBColor:
+    """Scale a segment color by HA brightness using integer math."""
+    scale = _Q8_SCALE[brightness]
+    r, g, b = rgb_color
+    return RGBColor(r=(r * scale) >> 8, g=(g * scale) >> 8, b=(b * scale) >> 8)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -43,17 +63,16 @@ async def async_setup_entry(
 
     entities: list[LightEntity] = []
 
-    for device in coordinator.devices.values():
-        if device.supports_segments and device.segment_count > 0:
-            # Create entity for each segment
-            for segment_index in range(device.segment_count):
-                entities.append(
-                    GoveeSegmentEntity(
-                        coordinator=coordinator,
-                        device=device,
-                        segment_index=segment_index,
-                    )
-                )
+    for device in coordinator.segment_devices:
+        # Create entity for each segment
+        entities.extend(
+            GoveeSegmentEntity(
+                coordinator=coordinator,
+                device=device,
+                segment_index=segment_index,
+            )
+            for segment_index in range(device.segment_count)
+        )
 
     async_add_entities(entities)
     _LOGGER.debug("Set up %d Govee segment entities", len(entities))
@@ -70,6 +89,18 @@ class GoveeSegmentEntity(LightEntity, RestoreEntity):
     to prevent API responses from overwriting local state.
     """
 
+    __slots__ = (
+        "_coordinator",
+        "_device",
+        "_device_id",
+        "_segment_index",
+        "_is_on",
+        "_brightness",
+        "_rgb_color",
+        "_color",
+        "_last_sent",
+    )
+
     _attr_has_entity_name = True
     _attr_translation_key = "govee_segment"
     _attr_supported_color_modes = {ColorMode.RGB}
@@ -109,12 +140,16 @@ class GoveeSegmentEntity(LightEntity, RestoreEntity):
         self._is_on = True
         self._brightness = 255
         self._rgb_color: tuple[int, int, int] = (255, 255, 255)
+        # Command color (_rgb_color scaled by _brightness), rebuilt on change
+        self._color = RGBColor(r=255, g=255, b=255)
+        # Monotonic time of the last color sent while on
+        self._last_sent = 0.0
 
     @property
     def device_info(self) -> DeviceInfo:
         """Return device information."""
         return DeviceInfo(
-            identifiers={(DOMAIN, self._device.device_id)},
+            identifiers={(DOMAIN, self._device_id)},
             name=self._device.name,
             manufacturer="Govee",
             model=self._device.sku,
@@ -144,44 +179,60 @@ class GoveeSegmentEntity(LightEntity, RestoreEntity):
         """Return RGB color."""
         return self._rgb_color
 
-    async def async_turn_on(self, **kwargs: Any) -> None:
-        """Turn the segment on with optional parameters."""
-        # Update brightness if provided
-        if ATTR_BRIGHTNESS in kwargs:
-            self._brightness = kwargs[ATTR_BRIGHTNESS]
-
-        # Update color if provided
-        if ATTR_RGB_COLOR in kwargs:
-            self._rgb_color = kwargs[ATTR_RGB_COLOR]
-
-        # Create segment color command
-        r, g, b = self._rgb_color
-        color = RGBColor(r=r, g=g, b=b)
-
-        command = SegmentColorCommand(
-            segment_indices=(self._segment_index,),
-            color=color,
+    def _set_color(self, rgb_color: tuple[int, int, int], brightness: int) -> None:
+        """Store segment color and brightness, rebuilding the command color."""
+        # Callers usually pass the stored tuple back unchanged; identity is
+        # checked before falling back to element-wise comparison
+        color_changed = (
+            rgb_color is not self._rgb_color and rgb_color != self._rgb_color
         )
+        if color_changed or brightness != self._brightness:
+            self._color = _scale_color(rgb_color, brightness)
+        self._rgb_color = rgb_color
+        self._brightness = brightness
+
+    async def async_turn_on(self, **kwargs: Any) -> None:
+        """Turn the segment on with optional parameters.
 
-        await self._coordinator.async_control_device(
+        Segments have no brightness command, so brightness is applied by
+        scaling the color that is sent.
+        """
+        previous_color = self._color
+        # A black stored color would leave the segment dark, so fall back to white
+        rgb_color = kwargs.get(ATTR_RGB_COLOR) or (
+            self._rgb_color if any(self._rgb_color) else SEGMENT_DEFAULT_RGB
+        )
+        self._set_color(rgb_color, kwargs.get(ATTR_BRIGHTNESS, self._brightness))
+
+        # Segment state is optimistic only, so just drop back-to-back
+        # duplicates (UI double sends) rather than every matching call
+        now = time.monotonic()
+        if (
+            self._is_on
+            and self._color is previous_color
+            and now - self._last_sent < SEGMENT_REPEAT_WINDOW
+        ):
+            self.async_write_ha_state()
+            return
+
+        # Coordinator merges segments changed in the same tick into one command
+        await self._coordinator.async_control_segment_color(
             self._device_id,
-            command,
+            self._segment_index,
+            self._color,
         )
 
+        self._last_sent = now
         self._is_on = True
         self.async_write_ha_state()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the segment off (set to black)."""
         # Set segment to black
-        command = SegmentColorCommand(
-            segment_indices=(self._segment_index,),
-            color=RGBColor(r=0, g=0, b=0),
-        )
-
-        await self._coordinator.async_control_device(
+        await self._coordinator.async_control_segment_color(
             self._device_id,
-            command,
+            self._segment_index,
+            SEGMENT_OFF_COLOR,
         )
 
         self._is_on = False
@@ -195,8 +246,14 @@ class GoveeSegmentEntity(LightEntity, RestoreEntity):
         if last_state:
             self._is_on = last_state.state == "on"
 
-            if last_state.attributes.get("brightness"):
-                self._brightness = last_state.attributes["brightness"]
+            brightness = last_state.attributes.get("brightness") or self._brightness
+
+            rgb = last_state.attributes.get("rgb_color")
+            # Restored attributes may be a list, or carry extra channels;
+            # take exactly three ints rather than copying the sequence
+            if rgb and len(rgb) >= 3:
+                rgb_color = (int(rgb[0]), int(rgb[1]), int(rgb[2]))
+            else:
+                rgb_color = self._rgb_color
 
-            if last_state.attributes.get("rgb_color"):
-                self._rgb_color = tuple(last_state.attributes["rgb_color"])
+            self._set_color(rgb_color, brightness)
@@ -11,7 +11,7 @@ from typing import Any
 
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo  # type: ignore[attr-defined]
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -52,6 +52,10 @@ async def async_setup_entry(
     coordinator: GoveeCoordinator = entry.runtime_data
 
     entities: list[SelectEntity] = []
+    scene_device_ids: list[str] = []
+    diy_device_ids: list[str] = []
+    pending_scene_devices: list[GoveeDevice] = []
+    pending_diy_devices: list[GoveeDevice] = []
 
     # Check if scenes are enabled
     enable_scenes = entry.options.get(CONF_ENABLE_SCENES, DEFAULT_ENABLE_SCENES)
@@ -85,10 +89,11 @@ async def async_setup_entry(
             )
             continue
 
-        # Dynamic scenes
+        # Dynamic scenes - seeded from cache, refreshed in the background.
+        # Devices with no cached scenes get their select once scenes arrive
         if enable_scenes and device.supports_scenes:
-            scenes = await coordinator.async_get_scenes(device.device_id)
-            _LOGGER.debug("Fetched %d scenes for %s", len(scenes), device.name)
+            scene_device_ids.append(device.device_id)
+            scenes = coordinator.get_cached_scenes(device.device_id)
             if scenes:
                 entities.append(
                     GoveeSceneSelectEntity(
@@ -98,11 +103,13 @@ async def async_setup_entry(
                     )
                 )
                 _LOGGER.debug("Created scene select entity for %s", device.name)
+            else:
+                pending_scene_devices.append(device)
 
-        # DIY scenes
+        # DIY scenes - seeded from cache, refreshed in the background
         if enable_diy_scenes and device.supports_diy_scenes:
-            diy_scenes = await coordinator.async_get_diy_scenes(device.device_id)
-            _LOGGER.debug("Fetched %d DIY scenes for %s", len(diy_scenes), device.name)
+            diy_device_ids.append(device.device_id)
+            diy_scenes = coordinator.get_cached_diy_scenes(device.device_id)
             if diy_scenes:
                 entities.append(
                     GoveeDIYSceneSelectEntity(
@@ -112,6 +119,8 @@ async def async_setup_entry(
                     )
                 )
                 _LOGGER.debug("Created DIY scene select entity for %s", device.name)
+            else:
+                pending_diy_devices.append(device)
 
             # DIY style selector (only if device supports DIY scenes)
             # Requires MQTT for BLE passthrough
@@ -124,18 +133,18 @@ async def async_setup_entry(
                 )
                 _LOGGER.debug("Created DIY style select entity for %s", device.name)
 
-        # HDMI source selector (for devices like AI Sync Box H6604)
-        if device.supports_hdmi_source:
-            hdmi_options = device.get_hdmi_source_options()
-            if hdmi_options:
-                entities.append(
-                    GoveeHdmiSourceSelectEntity(
-                        coordinator=coordinator,
-                        device=device,
-                        options=hdmi_options,
-                    )
+        # HDMI source selector (for devices like AI Sync Box H6604); the
+        # options lookup returns nothing for devices without the capability
+        hdmi_options = device.get_hdmi_source_options()
+        if hdmi_options:
+            entities.append(
+                GoveeHdmiSourceSelectEntity(
+                    coordinator=coordinator,
+                    device=device,
+                    options=hdmi_options,
                 )
-                _LOGGER.debug("Created HDMI source select entity for %s", device.name)
+            )
+            _LOGGER.debug("Created HDMI source select entity for %s", device.name)
 
         # Music mode selector (for devices with STRUCT-based music mode)
         if device.has_struct_music_mode:
@@ -157,6 +166,56 @@ async def async_setup_entry(
     async_add_entities(entities)
     _LOGGER.debug("Set up %d Govee scene select entities", len(entities))
 
+    # One serial refresh for all scene selects rather than a fetch per entity
+    if scene_device_ids or diy_device_ids:
+        entry.async_create_background_task(
+            hass,
+            _async_refresh_scene_selects(
+                coordinator,
+                async_add_entities,
+                scene_device_ids,
+                diy_device_ids,
+                pending_scene_devices,
+                pending_diy_devices,
+            ),
+            name=f"govee_scene_refresh_{entry.entry_id}",
+        )
+
+
+async def _async_refresh_scene_selects(
+    coordinator: GoveeCoordinator,
+    async_add_entities: AddEntitiesCallback,
+    scene_device_ids: list[str],
+    diy_device_ids: list[str],
+    pending_scene_devices: list[GoveeDevice],
+    pending_diy_devices: list[GoveeDevice],
+) -> None:
+    """Refresh scene lists, then add selects for devices that had none cached.
+
+    Args:
+        coordinator: Govee data coordinator.
+        async_add_entities: Callback to add the new select entities.
+        scene_device_ids: Devices whose scene lists are refreshed.
+        diy_device_ids: Devices whose DIY scene lists are refreshed.
+        pending_scene_devices: Devices set up without a scene select.
+        pending_diy_devices: Devices set up without a DIY scene select.
+    """
+    await coordinator.async_refresh_scene_lists(scene_device_ids, diy_device_ids)
+
+    entities: list[SelectEntity] = []
+    for device in pending_scene_devices:
+        scenes = coordinator.get_cached_scenes(device.device_id)
+        if scenes:
+            entities.append(GoveeSceneSelectEntity(coordinator, device, scenes))
+    for device in pending_diy_devices:
+        diy_scenes = coordinator.get_cached_diy_scenes(device.device_id)
+        if diy_scenes:
+            entities.append(GoveeDIYSceneSelectEntity(coordinator, device, diy_scenes))
+
+    if entities:
+        async_add_entities(entities)
+        _LOGGER.debug("Added %d scene select entities after refresh", len(entities))
+
 
 class GoveeSceneSelectEntity(CoordinatorEntity["GoveeCoordinator"], SelectEntity):
     """Govee scene select entity.
@@ -168,6 +227,14 @@ class GoveeSceneSelectEntity(CoordinatorEntity["GoveeCoordinator"], SelectEntity
     When Music Mode or DreamView is activated, the scene selection shows "None".
     """
 
+    __slots__ = (
+        "_device",
+        "_device_id",
+        "_scene_commands",
+        "_scene_id_to_option",
+        "_scene_source",
+    )
+
     _attr_has_entity_name = True
     _attr_translation_key = "govee_scene_select"
     _attr_icon = "mdi:palette"
@@ -183,17 +250,43 @@ class GoveeSceneSelectEntity(CoordinatorEntity["GoveeCoordinator"], SelectEntity
         Args:
             coordinator: Govee data coordinator.
             device: Device this select belongs to.
-            scenes: List of scene data from API.
+            scenes: Cached scene data shown until the background refresh.
         """
         super().__init__(coordinator)
 
         self._device = device
         self._device_id = device.device_id
 
-        # Build scene mapping: name -> (id, name)
-        self._scene_map: dict[str, tuple[int, str]] = {}
-        # Reverse mapping: scene_id (as string) -> option name
+        # Option name -> prebuilt scene command, and scene ID -> option name
+        self._scene_commands: dict[str, SceneCommand] = {}
         self._scene_id_to_option: dict[str, str] = {}
+        self._attr_options = [SCENE_NONE]
+        self._scene_source: list[dict[str, Any]] = []
+        self._set_scenes(scenes)
+
+        # Unique ID
+        self._attr_unique_id = f"{device.device_id}_scene_select"
+
+        # Entity name
+        self._attr_name = "Scene"
+
+    def _set_scenes(self, scenes: list[dict[str, Any]]) -> bool:
+        """Rebuild options from scene data.
+
+        Args:
+            scenes: Scene data from the coordinator cache or API.
+
+        Returns:
+            True if the available scenes changed.
+        """
+        # Refreshes usually return the same list; skip rebuilding the maps
+        if scenes == self._scene_source:
+            self._scene_source = scenes
+            return False
+
+        self._scene_source = scenes
+        scene_commands: dict[str, SceneCommand] = {}
+        scene_id_to_option: dict[str, str] = {}
         options = [SCENE_NONE]
 
         for scene_data in scenes:
@@ -203,27 +296,38 @@ class GoveeSceneSelectEntity(CoordinatorEntity["GoveeCoordinator"], SelectEntity
             # Handle duplicate names by appending ID
             unique_name = scene_name
             counter = 1
-            while unique_name in self._scene_map:
+            while unique_name in scene_commands:
                 unique_name = f"{scene_name} ({counter})"
                 counter += 1
 
-            self._scene_map[unique_name] = (scene_id, scene_name)
-            self._scene_id_to_option[str(scene_id)] = unique_name
+            scene_commands[unique_name] = SceneCommand(
+                scene_id=scene_id,
+                scene_name=scene_name,
+            )
+            scene_id_to_option[str(scene_id)] = unique_name
             options.append(unique_name)
 
-        self._attr_options = options
+        if scene_commands == self._scene_commands:
+            return False
 
-        # Unique ID
-        self._attr_unique_id = f"{device.device_id}_scene_select"
+        self._scene_commands = scene_commands
+        self._scene_id_to_option = scene_id_to_option
+        self._attr_options = options
+        return True
 
-        # Entity name
-        self._attr_name = "Scene"
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Pick up scene lists refreshed after setup or by the service or button."""
+        scenes = self.coordinator.get_cached_scenes(self._device_id)
+        if scenes is not self._scene_source:
+            self._set_scenes(scenes)
+        super()._handle_coordinator_update()
 
     @property
     def device_info(self) -> DeviceInfo:
         """Return device information."""
         return DeviceInfo(
-            identifiers={(DOMAIN, self._device.device_id)},
+            identifiers={(DOMAIN, self._device_id)},
             name=self._device.name,
             manufacturer="Govee",
             model=self._device.sku,
@@ -265,17 +369,12 @@ class GoveeSceneSelectEntity(CoordinatorEntity["GoveeCoordinator"], SelectEntity
             self.async_write_ha_state()
             return
 
-        scene_info = self._scene_map.get(option)
-        if not scene_info:
+        command = self._scene_commands.get(option)
+        if command is None:
             _LOGGER.warning("Unknown scene option: %s", option)
             return
 
-        scene_id, scene_name = scene_info
-
-        command = SceneCommand(
-            scene_id=scene_id,
-            scene_name=scene_name,
-        )
+        scene_name = command.scene_name
 
         success = await self.coordinator.async_control_device(
             self._device_id,
@@ -323,17 +422,43 @@ class GoveeDIYSceneSelectEntity(CoordinatorEntity["GoveeCoordinator"], SelectEnt
         Args:
             coordinator: Govee data coordinator.
             device: Device this select belongs to.
-            scenes: List of DIY scene data from API.
+            scenes: Cached DIY scene data shown until the background refresh.
         """
         super().__init__(coordinator)
 
         self._device = device
         self._device_id = device.device_id
 
-        # Build scene mapping: name -> (id, name)
-        self._scene_map: dict[str, tuple[int, str]] = {}
-        # Reverse mapping: scene_id (as string) -> option name
+        # Option name -> prebuilt DIY scene command, and scene ID -> option name
+        self._scene_commands: dict[str, DIYSceneCommand] = {}
         self._scene_id_to_option: dict[str, str] = {}
+        self._attr_options = [SCENE_NONE]
+        self._scene_source: list[dict[str, Any]] = []
+        self._set_scenes(scenes)
+
+        # Unique ID
+        self._attr_unique_id = f"{device.device_id}_diy_scene_select"
+
+        # Entity name
+        self._attr_name = "DIY Scene"
+
+    def _set_scenes(self, scenes: list[dict[str, Any]]) -> bool:
+        """Rebuild options from scene data.
+
+        Args:
+            scenes: Scene data from the coordinator cache or API.
+
+        Returns:
+            True if the available scenes changed.
+        """
+        # Refreshes usually return the same list; skip rebuilding the maps
+        if scenes == self._scene_source:
+            self._scene_source = scenes
+            return False
+
+        self._scene_source = scenes
+        scene_commands: dict[str, DIYSceneCommand] = {}
+        scene_id_to_option: dict[str, str] = {}
         options = [SCENE_NONE]
 
         for scene_data in scenes:
@@ -344,27 +469,38 @@ class GoveeDIYSceneSelectEntity(CoordinatorEntity["GoveeCoordinator"], SelectEnt
             # Handle duplicate names by appending ID
             unique_name = scene_name
             counter = 1
-            while unique_name in self._scene_map:
+            while unique_name in scene_commands:
                 unique_name = f"{scene_name} ({counter})"
                 counter += 1
 
-            self._scene_map[unique_name] = (scene_id, scene_name)
-            self._scene_id_to_option[str(scene_id)] = unique_name
+            scene_commands[unique_name] = DIYSceneCommand(
+                scene_id=scene_id,
+                scene_name=scene_name,
+            )
+            scene_id_to_option[str(scene_id)] = unique_name
             options.append(unique_name)
 
-        self._attr_options = options
+        if scene_commands == self._scene_commands:
+            return False
 
-        # Unique ID
-        self._attr_unique_id = f"{device.device_id}_diy_scene_select"
+        self._scene_commands = scene_commands
+        self._scene_id_to_option = scene_id_to_option
+        self._attr_options = options
+        return True
 
-        # Entity name
-        self._attr_name = "DIY Scene"
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Pick up DIY scene lists refreshed after setup or by the service or button."""
+        scenes = self.coordinator.get_cached_diy_scenes(self._device_id)
+        if scenes is not self._scene_source:
+            self._set_scenes(scenes)
+        super()._handle_coordinator_update()
 
     @property
     def device_info(self) -> DeviceInfo:
         """Return device information."""
         return DeviceInfo(
-            identifiers={(DOMAIN, self._device.device_id)},
+            identifiers={(DOMAIN, self._device_id)},
             name=self._device.name,
             manufacturer="Govee",
             model=self._device.sku,
@@ -406,17 +542,12 @@ class GoveeDIYSceneSelectEntity(CoordinatorEntity["GoveeCoordinator"], SelectEnt
             self.async_write_ha_state()
             return
 
-        scene_info = self._scene_map.get(option)
-        if not scene_info:
+        command = self._scene_commands.get(option)
+        if command is None:
             _LOGGER.warning("Unknown DIY scene option: %s", option)
             return
 
-        scene_id, scene_name = scene_info
-
-        command = DIYSceneCommand(
-            scene_id=scene_id,
-            scene_name=scene_name,
-        )
+        scene_name = command.scene_name
 
         success = await self.coordinator.async_control_device(
             self._device_id,
@@ -498,7 +629,7 @@ class GoveeDIYStyleSelectEntity(CoordinatorEntity["GoveeCoordinator"], SelectEnt
     def device_info(self) -> DeviceInfo:
         """Return device information."""
         return DeviceInfo(
-            identifiers={(DOMAIN, self._device.device_id)},
+            identifiers={(DOMAIN, self._device_id)},
             name=self._device.name,
             manufacturer="Govee",
             model=self._device.sku,
@@ -585,8 +716,10 @@ class GoveeHdmiSourceSelectEntity(CoordinatorEntity["GoveeCoordinator"], SelectE
         self._device = device
         self._device_id = device.device_id
 
-        # Build option mapping: display name -> value
+        # Build option mapping: display name -> value, plus the reverse
+        # mapping used to resolve the current option from state
         self._option_map: dict[str, int] = {}
+        self._value_to_option: dict[int, str] = {}
         option_names: list[str] = []
 
         for opt in options:
@@ -594,6 +727,7 @@ class GoveeHdmiSourceSelectEntity(CoordinatorEntity["GoveeCoordinator"], SelectE
             value = opt.get("value")
             if name and value is not None:
                 self._option_map[name] = value
+                self._value_to_option.setdefault(value, name)
                 option_names.append(name)
 
         self._attr_options = option_names
@@ -608,7 +742,7 @@ class GoveeHdmiSourceSelectEntity(CoordinatorEntity["GoveeCoordinator"], SelectE
     def device_info(self) -> DeviceInfo:
         """Return device information."""
         return DeviceInfo(
-            identifiers={(DOMAIN, self._device.device_id)},
+            identifiers={(DOMAIN, self._device_id)},
             name=self._device.name,
             manufacturer="Govee",
             model=self._device.sku,
@@ -627,10 +761,9 @@ class GoveeHdmiSourceSelectEntity(CoordinatorEntity["GoveeCoordinator"], SelectE
         """Return current selected option from state."""
         state = self.coordinator.get_state(self._device_id)
         if state and state.hdmi_source is not None:
-            # Find option name matching the current value
-            for name, value in self._option_map.items():
-                if value == state.hdmi_source:
-                    return name
+            option = self._value_to_option.get(state.hdmi_source)
+            if option is not None:
+                return option
         # Return first option as default if available
         return self._attr_options[0] if self._attr_options else None
 
@@ -733,7 +866,7 @@ class GoveeMusicModeSelectEntity(CoordinatorEntity["GoveeCoordinator"], SelectEn
     def device_info(self) -> DeviceInfo:
         """Return device information."""
         return DeviceInfo(
-            identifiers={(DOMAIN, self._device.device_id)},
+            identifiers={(DOMAIN, self._device_id)},
             name=self._device.name,
             manufacturer="Govee",
             model=self._device.sku,
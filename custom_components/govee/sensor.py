@@ -16,7 +16,7 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo  # type: ignore[attr-defined]
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -71,6 +71,21 @@ class GoveeRateLimitSensor(CoordinatorEntity["GoveeCoordinator"], SensorEntity):
         self._attr_unique_id = f"{entry_id}_rate_limit"
         self._attr_name = "API Rate Limit Remaining"
 
+        # Client lives as long as the coordinator; bind it once for reads
+        self._api_client = coordinator._api_client
+        self._attr_available = coordinator.last_update_success
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Cache coordinator availability before writing state."""
+        self._attr_available = self.coordinator.last_update_success
+        super()._handle_coordinator_update()
+
+    @property
+    def available(self) -> bool:
+        """Return availability cached on the last coordinator update."""
+        return self._attr_available
+
     @property
     def device_info(self) -> DeviceInfo:
         """Return device info for the integration hub."""
@@ -84,12 +99,12 @@ class GoveeRateLimitSensor(CoordinatorEntity["GoveeCoordinator"], SensorEntity):
     @property
     def native_value(self) -> int:
         """Return the current rate limit remaining."""
-        return self.coordinator._api_client.rate_limit_remaining
+        return self._api_client.rate_limit_remaining
 
     @property
     def extra_state_attributes(self) -> dict[str, int]:
         """Return additional rate limit info."""
-        client = self.coordinator._api_client
+        client = self._api_client
         return {
             "total_limit": client.rate_limit_total,
             "reset_time": client.rate_limit_reset,
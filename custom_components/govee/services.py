@@ -65,6 +65,8 @@ async def async_setup_services(hass: HomeAssistant) -> None:
                     if device.supports_scenes:
                         await coordinator.async_get_scenes(dev_id, refresh=True)
                 _LOGGER.info("Refreshed scenes for all devices")
+            # Let the scene selects pick up the new lists
+            coordinator.async_update_listeners()
 
     async def async_set_segment_color(call: ServiceCall) -> None:
         """Set color for specific segments."""
@@ -109,13 +111,6 @@ async def async_setup_services(hass: HomeAssistant) -> None:
     _LOGGER.debug("Govee services registered")
 
 
-async def async_unload_services(hass: HomeAssistant) -> None:
-    """Unload Govee services."""
-    hass.services.async_remove(DOMAIN, SERVICE_REFRESH_SCENES)
-    hass.services.async_remove(DOMAIN, SERVICE_SET_SEGMENT_COLOR)
-    _LOGGER.debug("Govee services unloaded")
-
-
 def _get_coordinators(hass: HomeAssistant) -> list[GoveeCoordinator]:
     """Get all Govee coordinators."""
     coordinators = []
@@ -7,7 +7,9 @@ Provides switch entities for:
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 from typing import Any
 
 from homeassistant.components.switch import SwitchDeviceClass, SwitchEntity
@@ -18,14 +20,18 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from .coordinator import GoveeCoordinator
 from .entity import GoveeEntity
 from .models import (
+    POWER_OFF,
+    POWER_ON,
     GoveeDevice,
     MusicModeCommand,
-    PowerCommand,
     create_night_light_command,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Window (seconds) in which a repeated night light command is dropped
+NIGHT_LIGHT_REPEAT_WINDOW = 0.2
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -95,6 +101,7 @@ class GoveePlugSwitchEntity(GoveeEntity, SwitchEntity):
 
     _attr_device_class = SwitchDeviceClass.OUTLET
     _attr_translation_key = "govee_plug"
+    _attr_name = None  # Use device name
 
     def __init__(
         self,
@@ -104,27 +111,24 @@ class GoveePlugSwitchEntity(GoveeEntity, SwitchEntity):
         """Initialize the plug switch entity."""
         super().__init__(coordinator, device)
 
-        # Use device name as entity name
-        self._attr_name = None
-
     @property
     def is_on(self) -> bool | None:
         """Return True if plug is on."""
-        state = self.device_state
+        state = self._cached_state
         return state.power_state if state else None
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the plug on."""
         await self.coordinator.async_control_device(
             self._device_id,
-            PowerCommand(power_on=True),
+            POWER_ON,
         )
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the plug off."""
         await self.coordinator.async_control_device(
             self._device_id,
-            PowerCommand(power_on=False),
+            POWER_OFF,
         )
 
 
@@ -135,7 +139,11 @@ class GoveeNightLightSwitchEntity(GoveeEntity, SwitchEntity):
     Uses optimistic state since API may not return night light status.
     """
 
+    __slots__ = ("_is_on", "_pending", "_pending_enabled", "_last_sent")
+
     _attr_translation_key = "govee_night_light"
+    _attr_name = "Night Light"
+    _id_suffix = "_night_light"
 
     def __init__(
         self,
@@ -145,15 +153,15 @@ class GoveeNightLightSwitchEntity(GoveeEntity, SwitchEntity):
         """Initialize the night light switch entity."""
         super().__init__(coordinator, device)
 
-        # Unique ID for night light switch
-        self._attr_unique_id = f"{device.device_id}_night_light"
-
-        # Name as "Night Light"
-        self._attr_name = "Night Light"
-
         # Optimistic state
         self._is_on = False
 
+        # Command in flight and when the last one succeeded, used to
+        # coalesce rapid repeats into a single API call
+        self._pending: asyncio.Future[bool] | None = None
+        self._pending_enabled = False
+        self._last_sent = 0.0
+
     @property
     def is_on(self) -> bool:
         """Return True if night light is on."""
@@ -161,22 +169,47 @@ class GoveeNightLightSwitchEntity(GoveeEntity, SwitchEntity):
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn night light on."""
-        success = await self.coordinator.async_control_device(
-            self._device_id,
-            create_night_light_command(enabled=True),
-        )
-        if success:
-            self._is_on = True
-            self.async_write_ha_state()
+        await self._async_set_night_light(True)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn night light off."""
-        success = await self.coordinator.async_control_device(
-            self._device_id,
-            create_night_light_command(enabled=False),
-        )
+        await self._async_set_night_light(False)
+
+    async def _async_set_night_light(self, enabled: bool) -> None:
+        """Send a night light command unless an identical one is redundant.
+
+        A call matching the command in flight waits on it instead of
+        sending again, and a repeat of the state just confirmed within
+        NIGHT_LIGHT_REPEAT_WINDOW is dropped.
+        """
+        pending = self._pending
+        if pending is not None and self._pending_enabled is enabled:
+            # Shield so a cancelled waiter doesn't cancel the shared result
+            await asyncio.shield(pending)
+            return
+
+        if (
+            self._is_on is enabled
+            and time.monotonic() - self._last_sent < NIGHT_LIGHT_REPEAT_WINDOW
+        ):
+            return
+
+        pending = self._pending = asyncio.get_running_loop().create_future()
+        self._pending_enabled = enabled
+        success = False
+        try:
+            success = await self.coordinator.async_control_device(
+                self._device_id,
+                create_night_light_command(enabled=enabled),
+            )
+        finally:
+            pending.set_result(success)
+            if self._pending is pending:
+                self._pending = None
+
         if success:
-            self._is_on = False
+            self._last_sent = time.monotonic()
+            self._is_on = enabled
             self.async_write_ha_state()
 
 
@@ -198,8 +231,12 @@ class GoveeMusicModeSwitchEntity(GoveeEntity, SwitchEntity):
     Uses optimistic state since API may not return music mode status.
     """
 
+    __slots__ = ("_use_rest_api", "_is_on")
+
     _attr_translation_key = "govee_music_mode"
     _attr_icon = "mdi:music"
+    _attr_name = "Music Mode"
+    _id_suffix = "_music_mode"
 
     def __init__(
         self,
@@ -218,12 +255,6 @@ class GoveeMusicModeSwitchEntity(GoveeEntity, SwitchEntity):
 
         self._use_rest_api = use_rest_api
 
-        # Unique ID for music mode switch
-        self._attr_unique_id = f"{device.device_id}_music_mode"
-
-        # Name as "Music Mode"
-        self._attr_name = "Music Mode"
-
         # Optimistic state
         self._is_on = False
 
@@ -241,7 +272,7 @@ class GoveeMusicModeSwitchEntity(GoveeEntity, SwitchEntity):
     @property
     def is_on(self) -> bool:
         """Return True if music mode is on."""
-        state = self.device_state
+        state = self._cached_state
         if state and state.music_mode_enabled is not None:
             return state.music_mode_enabled
         return self._is_on
@@ -251,7 +282,7 @@ class GoveeMusicModeSwitchEntity(GoveeEntity, SwitchEntity):
         if self._use_rest_api:
             # Use REST API with STRUCT payload
             # Get current sensitivity and mode from state, or use defaults
-            state = self.device_state
+            state = self._cached_state
             sensitivity = 50
             music_mode = 1  # Default to Rhythm mode
             if state:
@@ -294,7 +325,7 @@ class GoveeMusicModeSwitchEntity(GoveeEntity, SwitchEntity):
             # STRUCT-based devices: Clear optimistic state
             # Note: There's no explicit "off" for STRUCT music mode
             # The user should switch to a scene or color to exit music mode
-            state = self.device_state
+            state = self._cached_state
             if state:
                 state.music_mode_enabled = False
                 state.source = "optimistic"
@@ -327,20 +358,8 @@ class GoveeDreamViewSwitchEntity(GoveeEntity, SwitchEntity):
 
     _attr_translation_key = "govee_dreamview"
     _attr_icon = "mdi:movie-open"
-
-    def __init__(
-        self,
-        coordinator: GoveeCoordinator,
-        device: GoveeDevice,
-    ) -> None:
-        """Initialize the DreamView switch entity."""
-        super().__init__(coordinator, device)
-
-        # Unique ID for DreamView switch
-        self._attr_unique_id = f"{device.device_id}_dreamview"
-
-        # Name as "DreamView"
-        self._attr_name = "DreamView"
+    _attr_name = "DreamView"
+    _id_suffix = "_dreamview"
 
     @property
     def available(self) -> bool:
@@ -358,7 +377,7 @@ class GoveeDreamViewSwitchEntity(GoveeEntity, SwitchEntity):
 
         Reads from device state for proper mutual exclusion tracking.
         """
-        state = self.device_state
+        state = self._cached_state
         if state and state.dreamview_enabled is not None:
             return state.dreamview_enabled
         return False
@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import asyncio
+import itertools
 from typing import Any
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -14,15 +15,19 @@ from custom_components.govee.api.exceptions import (
     GoveeDeviceNotFoundError,
     GoveeRateLimitError,
 )
+from custom_components.govee.coordinator import GoveeCoordinator
 from custom_components.govee.models import (
     GoveeCapability,
     GoveeDevice,
     GoveeDeviceState,
+    POWER_OFF,
+    POWER_ON,
     PowerCommand,
     BrightnessCommand,
     ColorCommand,
     ColorTempCommand,
     SceneCommand,
+    SegmentColorCommand,
     RGBColor,
 )
 from custom_components.govee.models.device import (
@@ -32,7 +37,11 @@ from custom_components.govee.models.device import (
     INSTANCE_BRIGHTNESS,
 )
 from custom_components.govee.protocols import IStateObserver
-
+from custom_components.govee.select import (
+    SCENE_NONE,
+    GoveeSceneSelectEntity,
+    _async_refresh_scene_selects,
+)
 
 # ==============================================================================
 # Fixtures
@@ -395,7 +404,9 @@ class TestErrorHandling:
         """Test device not found is expected for groups."""
         err = GoveeDeviceNotFoundError("GROUP:ID")
 
-        is_group_error = "not exist" in str(err).lower() or "not found" in str(err).lower()
+        is_group_error = (
+            "not exist" in str(err).lower() or "not found" in str(err).lower()
+        )
 
         assert is_group_error or err.code == 400
 
@@ -457,10 +468,7 @@ class TestParallelStateFetching:
         async def mock_fetch(device_id, device):
             return GoveeDeviceState.create_empty(device_id)
 
-        tasks = [
-            mock_fetch(device_id, device)
-            for device_id, device in devices.items()
-        ]
+        tasks = [mock_fetch(device_id, device) for device_id, device in devices.items()]
 
         results = await asyncio.gather(*tasks)
 
@@ -631,3 +639,473 @@ class TestCoordinatorSceneManagement:
             del cache["device_id"]
 
         assert "device_id" not in cache
+
+    @pytest.fixture
+    def scene_coordinator(self, mock_rgbic_device):
+        """Create a bare coordinator with an empty scene store."""
+        coordinator = GoveeCoordinator.__new__(GoveeCoordinator)
+        coordinator._devices = {mock_rgbic_device.device_id: mock_rgbic_device}
+        coordinator._scene_cache = {}
+        coordinator._diy_scene_cache = {}
+        coordinator._stored_scenes = {}
+        coordinator._scene_store = MagicMock()
+        coordinator._api_client = MagicMock()
+        coordinator._api_client.get_dynamic_scenes = AsyncMock(
+            return_value=[{"name": "Sunrise", "value": {"id": 1}}]
+        )
+        coordinator._api_client.get_diy_scenes = AsyncMock(
+            return_value=[{"name": "Party", "value": {"id": 7}}]
+        )
+        coordinator.async_update_listeners = MagicMock()
+        return coordinator
+
+    @pytest.mark.asyncio
+    async def test_first_install_adds_selects_after_refresh(
+        self, scene_coordinator, mock_rgbic_device
+    ):
+        """Test devices with nothing cached get their selects once scenes arrive."""
+        device_id = mock_rgbic_device.device_id
+        async_add_entities = MagicMock()
+
+        await _async_refresh_scene_selects(
+            scene_coordinator,
+            async_add_entities,
+            [device_id],
+            [device_id],
+            [mock_rgbic_device],
+            [mock_rgbic_device],
+        )
+
+        # One fetch per list for the whole setup, then a single notification
+        scene_coordinator._api_client.get_dynamic_scenes.assert_awaited_once()
+        scene_coordinator._api_client.get_diy_scenes.assert_awaited_once()
+        scene_coordinator.async_update_listeners.assert_called_once()
+
+        async_add_entities.assert_called_once()
+        scene_select, diy_select = async_add_entities.call_args.args[0]
+        assert scene_select.options == [SCENE_NONE, "Sunrise"]
+        assert diy_select.options == [SCENE_NONE, "Party"]
+
+    @pytest.mark.asyncio
+    async def test_no_select_for_device_without_scenes(
+        self, scene_coordinator, mock_rgbic_device
+    ):
+        """Test a device whose scene lists stay empty gets no select."""
+        scene_coordinator._api_client.get_dynamic_scenes.return_value = []
+        scene_coordinator._api_client.get_diy_scenes.return_value = []
+        device_id = mock_rgbic_device.device_id
+        async_add_entities = MagicMock()
+
+        await _async_refresh_scene_selects(
+            scene_coordinator,
+            async_add_entities,
+            [device_id],
+            [device_id],
+            [mock_rgbic_device],
+            [mock_rgbic_device],
+        )
+
+        async_add_entities.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_existing_select_picks_up_refreshed_list(
+        self, scene_coordinator, mock_rgbic_device
+    ):
+        """Test a select seeded from the store shows the refreshed list."""
+        device_id = mock_rgbic_device.device_id
+        scene_coordinator._stored_scenes = {
+            "scenes": {device_id: [{"name": "Sunset", "value": {"id": 2}}]}
+        }
+        scene_select = GoveeSceneSelectEntity(
+            scene_coordinator,
+            mock_rgbic_device,
+            scenes=scene_coordinator.get_cached_scenes(device_id),
+        )
+        assert scene_select.options == [SCENE_NONE, "Sunset"]
+
+        await scene_coordinator.async_refresh_scene_lists([device_id], [])
+
+        scene_select.async_write_ha_state = MagicMock()
+        scene_select._handle_coordinator_update()
+        assert scene_select.options == [SCENE_NONE, "Sunrise"]
+
+
+class TestSegmentColorCoalescing:
+    """Test coalescing of per-segment color commands."""
+
+    @pytest.fixture
+    def coordinator(self):
+        """Create a bare coordinator with a mocked control path."""
+        coordinator = GoveeCoordinator.__new__(GoveeCoordinator)
+        coordinator._pending_segment_colors = {}
+        coordinator.async_control_device = AsyncMock(return_value=True)
+        return coordinator
+
+    @pytest.mark.asyncio
+    async def test_same_tick_segments_share_command(self, coordinator):
+        """Test segments set in the same tick are merged per color."""
+        red = RGBColor(r=255, g=0, b=0)
+        blue = RGBColor(r=0, g=0, b=255)
+
+        results = await asyncio.gather(
+            coordinator.async_control_segment_color("device", 2, red),
+            coordinator.async_control_segment_color("device", 0, red),
+            coordinator.async_control_segment_color("device", 1, blue),
+        )
+
+        assert results == [True, True, True]
+        assert coordinator.async_control_device.call_count == 2
+        commands = [c[0][1] for c in coordinator.async_control_device.call_args_list]
+        assert commands[0].segment_indices == (0, 2)
+        assert commands[0].color == red
+        assert commands[1].segment_indices == (1,)
+        assert commands[1].color == blue
+        assert coordinator._pending_segment_colors == {}
+
+    @pytest.mark.asyncio
+    async def test_separate_ticks_send_separately(self, coordinator):
+        """Test sequential calls are not held back for batching."""
+        red = RGBColor(r=255, g=0, b=0)
+
+        await coordinator.async_control_segment_color("device", 0, red)
+        await coordinator.async_control_segment_color("device", 1, red)
+
+        assert coordinator.async_control_device.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failure_propagates_to_all_callers(self, coordinator):
+        """Test a failed batch raises for every merged segment."""
+        coordinator.async_control_device.side_effect = GoveeApiError("boom")
+        red = RGBColor(r=255, g=0, b=0)
+
+        results = await asyncio.gather(
+            coordinator.async_control_segment_color("device", 0, red),
+            coordinator.async_control_segment_color("device", 1, red),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, GoveeApiError) for r in results)
+        assert coordinator.async_control_device.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_sender_releases_joined_callers(self, coordinator):
+        """Test cancelling the sending caller doesn't strand joined segments."""
+        started = asyncio.Event()
+
+        async def slow_control(device_id, command):
+            started.set()
+            await asyncio.sleep(10)
+            return True
+
+        coordinator.async_control_device.side_effect = slow_control
+        red = RGBColor(r=255, g=0, b=0)
+        blue = RGBColor(r=0, g=0, b=255)
+
+        leader = asyncio.ensure_future(
+            coordinator.async_control_segment_color("device", 0, red)
+        )
+        same_color = asyncio.ensure_future(
+            coordinator.async_control_segment_color("device", 1, red)
+        )
+        other_color = asyncio.ensure_future(
+            coordinator.async_control_segment_color("device", 2, blue)
+        )
+        await started.wait()
+        leader.cancel()
+
+        results = await asyncio.wait_for(
+            asyncio.gather(leader, same_color, other_color, return_exceptions=True),
+            timeout=1,
+        )
+
+        assert all(isinstance(r, asyncio.CancelledError) for r in results)
+        assert coordinator._pending_segment_colors == {}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_joiner_leaves_batch_intact(self, coordinator):
+        """Test cancelling a joined caller doesn't fail the sender's batch."""
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def slow_control(device_id, command):
+            started.set()
+            await release.wait()
+            return True
+
+        coordinator.async_control_device.side_effect = slow_control
+        red = RGBColor(r=255, g=0, b=0)
+        blue = RGBColor(r=0, g=0, b=255)
+
+        leader = asyncio.ensure_future(
+            coordinator.async_control_segment_color("device", 0, red)
+        )
+        same_color = asyncio.ensure_future(
+            coordinator.async_control_segment_color("device", 1, red)
+        )
+        other_color = asyncio.ensure_future(
+            coordinator.async_control_segment_color("device", 2, blue)
+        )
+        await started.wait()
+        same_color.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.wait_for(leader, timeout=1) is True
+        assert await asyncio.wait_for(other_color, timeout=1) is True
+        assert same_color.cancelled()
+        # Both color groups were still sent
+        assert coordinator.async_control_device.await_count == 2
+
+
+class TestControlCommandPacing:
+    """Test per-device serialization of control commands."""
+
+    @pytest.fixture
+    def coordinator(self, sample_device, monkeypatch):
+        """Create a bare coordinator with a mocked API client."""
+        import custom_components.govee.coordinator as coordinator_module
+
+        monkeypatch.setattr(coordinator_module, "COMMAND_MIN_INTERVAL", 0.01)
+        monkeypatch.setattr(coordinator_module, "CONTROL_UPDATE_WINDOW", 0.01)
+        coordinator = GoveeCoordinator.__new__(GoveeCoordinator)
+        coordinator.hass = MagicMock()
+        coordinator._devices = {sample_device.device_id: sample_device}
+        coordinator._states = {}
+        coordinator._command_locks = {}
+        coordinator._last_command_time = {}
+        coordinator._latest_commands = {}
+        coordinator._command_tokens = itertools.count()
+        coordinator._control_update_handle = None
+        coordinator._api_client = MagicMock()
+        coordinator.async_set_updated_data = MagicMock()
+        return coordinator
+
+    @pytest.mark.asyncio
+    async def test_same_device_commands_do_not_overlap(
+        self, coordinator, sample_device
+    ):
+        """Test concurrent commands to one device are sent one at a time."""
+        in_flight = 0
+        max_in_flight = 0
+
+        async def control(device_id, sku, command):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return True
+
+        coordinator._api_client.control_device = control
+
+        results = await asyncio.gather(
+            coordinator.async_control_device(
+                sample_device.device_id, PowerCommand(power_on=True)
+            ),
+            coordinator.async_control_device(
+                sample_device.device_id, BrightnessCommand(brightness=50)
+            ),
+        )
+
+        assert results == [True, True]
+        assert max_in_flight == 1
+        assert sample_device.device_id in coordinator._last_command_time
+
+    @pytest.mark.asyncio
+    async def test_superseded_commands_are_dropped(self, coordinator, sample_device):
+        """Test only the newest queued command per capability is sent."""
+        coordinator._api_client.control_device = AsyncMock(return_value=True)
+
+        results = await asyncio.gather(
+            coordinator.async_control_device(
+                sample_device.device_id, BrightnessCommand(brightness=10)
+            ),
+            coordinator.async_control_device(
+                sample_device.device_id, BrightnessCommand(brightness=20)
+            ),
+            coordinator.async_control_device(
+                sample_device.device_id, BrightnessCommand(brightness=30)
+            ),
+            coordinator.async_control_device(
+                sample_device.device_id, PowerCommand(power_on=True)
+            ),
+        )
+
+        assert results == [True, True, True, True]
+        sent = [c[0][2] for c in coordinator._api_client.control_device.call_args_list]
+        # First brightness was already sending; the middle one was superseded
+        assert sent == [
+            BrightnessCommand(brightness=10),
+            BrightnessCommand(brightness=30),
+            PowerCommand(power_on=True),
+        ]
+        assert coordinator._latest_commands[sample_device.device_id] == {}
+
+    @pytest.mark.asyncio
+    async def test_shared_command_instances_supersede(self, coordinator, sample_device):
+        """Test queued shared POWER_ON/POWER_OFF instances keep call order."""
+        coordinator._api_client.control_device = AsyncMock(return_value=True)
+        device_id = sample_device.device_id
+
+        results = await asyncio.gather(
+            coordinator.async_control_device(
+                device_id, BrightnessCommand(brightness=5)
+            ),
+            coordinator.async_control_device(device_id, POWER_ON),
+            coordinator.async_control_device(
+                device_id, BrightnessCommand(brightness=20)
+            ),
+            coordinator.async_control_device(device_id, POWER_OFF),
+            coordinator.async_control_device(device_id, POWER_ON),
+        )
+
+        assert results == [True, True, True, True, True]
+        sent = [c[0][2] for c in coordinator._api_client.control_device.call_args_list]
+        # Only the last power call is sent, in its own place in the queue;
+        # the earlier POWER_ON is the same object but was superseded
+        assert sent == [
+            BrightnessCommand(brightness=5),
+            BrightnessCommand(brightness=20),
+            POWER_ON,
+        ]
+        assert coordinator._latest_commands[device_id] == {}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_command_clears_latest_entry(
+        self, coordinator, sample_device
+    ):
+        """Test a cancelled queued command doesn't leave a stale entry."""
+        coordinator._api_client.control_device = AsyncMock(return_value=True)
+        device_id = sample_device.device_id
+
+        first = asyncio.ensure_future(
+            coordinator.async_control_device(device_id, POWER_ON)
+        )
+        queued = asyncio.ensure_future(
+            coordinator.async_control_device(
+                device_id, BrightnessCommand(brightness=10)
+            )
+        )
+        await asyncio.sleep(0)
+        queued.cancel()
+        await asyncio.gather(first, queued, return_exceptions=True)
+
+        assert coordinator._latest_commands[device_id] == {}
+
+    @pytest.mark.asyncio
+    async def test_has_pending_command(self, coordinator, sample_device):
+        """Test queued and in-flight commands are reported until sent."""
+        coordinator._api_client.control_device = AsyncMock(return_value=True)
+        device_id = sample_device.device_id
+        assert not coordinator.has_pending_command(device_id, POWER_ON)
+
+        first = asyncio.ensure_future(
+            coordinator.async_control_device(
+                device_id, BrightnessCommand(brightness=10)
+            )
+        )
+        queued = asyncio.ensure_future(
+            coordinator.async_control_device(device_id, POWER_OFF)
+        )
+        await asyncio.sleep(0)
+
+        # Power commands share a target, so either state is reported
+        assert coordinator.has_pending_command(device_id, POWER_ON)
+
+        await asyncio.gather(first, queued)
+
+        assert not coordinator.has_pending_command(device_id, POWER_ON)
+
+    @pytest.mark.asyncio
+    async def test_segment_command_skips_coordinator_broadcast(
+        self, coordinator, sample_device
+    ):
+        """Test only commands that change coordinator state notify listeners."""
+        coordinator._states = {
+            sample_device.device_id: GoveeDeviceState.create_empty(
+                sample_device.device_id
+            )
+        }
+        coordinator._api_client.control_device = AsyncMock(return_value=True)
+        coordinator.hass.loop = asyncio.get_running_loop()
+
+        await coordinator.async_control_device(
+            sample_device.device_id,
+            SegmentColorCommand(segment_indices=(0,), color=RGBColor(255, 0, 0)),
+        )
+        assert coordinator._control_update_handle is None
+
+        await coordinator.async_control_device(
+            sample_device.device_id, PowerCommand(power_on=True)
+        )
+        await asyncio.sleep(0.02)
+        coordinator.async_set_updated_data.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_command_updates_share_one_notification(
+        self, coordinator, sample_device, monkeypatch
+    ):
+        """Test optimistic updates landing close together notify once."""
+        import custom_components.govee.coordinator as coordinator_module
+
+        monkeypatch.setattr(coordinator_module, "CONTROL_UPDATE_WINDOW", 0.05)
+        coordinator._states = {
+            sample_device.device_id: GoveeDeviceState.create_empty(
+                sample_device.device_id
+            )
+        }
+        coordinator._api_client.control_device = AsyncMock(return_value=True)
+        coordinator.hass.loop = asyncio.get_running_loop()
+
+        await coordinator.async_control_device(
+            sample_device.device_id, PowerCommand(power_on=True)
+        )
+        await coordinator.async_control_device(
+            sample_device.device_id, BrightnessCommand(brightness=50)
+        )
+        coordinator.async_set_updated_data.assert_not_called()
+
+        await asyncio.sleep(0.1)
+        coordinator.async_set_updated_data.assert_called_once()
+        state = coordinator._states[sample_device.device_id]
+        assert state.power_state is True
+        assert state.brightness == 50
+
+
+class TestCachedSceneLookup:
+    """Test non-fetching scene lookups used to seed select entities."""
+
+    @pytest.fixture
+    def coordinator(self):
+        """Create a bare coordinator with empty scene caches."""
+        coordinator = GoveeCoordinator.__new__(GoveeCoordinator)
+        coordinator._scene_cache = {}
+        coordinator._diy_scene_cache = {}
+        coordinator._stored_scenes = {}
+        return coordinator
+
+    def test_falls_back_to_stored_scenes(self, coordinator):
+        """Test scenes persisted from the last run are served when not fetched."""
+        stored = [{"name": "Sunrise", "value": {"id": 1}}]
+        coordinator._stored_scenes = {"scenes": {"device": stored}}
+
+        assert coordinator.get_cached_scenes("device") == stored
+        assert coordinator.get_cached_diy_scenes("device") == []
+
+    def test_fetched_scenes_take_precedence(self, coordinator):
+        """Test a fetched list (even empty) replaces the stored one."""
+        coordinator._stored_scenes = {
+            "scenes": {"device": [{"name": "Old", "value": {"id": 1}}]},
+            "diy_scenes": {"device": [{"name": "Old DIY", "value": 2}]},
+        }
+        coordinator._scene_cache["device"] = []
+        coordinator._diy_scene_cache["device"] = [{"name": "New", "value": 3}]
+
+        assert coordinator.get_cached_scenes("device") == []
+        assert coordinator.get_cached_diy_scenes("device") == [
+            {"name": "New", "value": 3}
+        ]
+
+    def test_unknown_device_returns_empty(self, coordinator):
+        """Test lookups for unknown devices return an empty list."""
+        assert coordinator.get_cached_scenes("missing") == []
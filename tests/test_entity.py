@@ -0,0 +1,29 @@
+"""Test Govee base entity helpers."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.govee.entity import _infer_area_from_name
+
+
+class TestInferAreaFromName:
+    """Test suggested area inference from device names."""
+
+    @pytest.mark.parametrize(
+        ("name", "area"),
+        [
+            ("Living Room Lamp", "Living Room"),
+            ("bedroom led strip", "Bedroom"),
+            ("Master Bedroom Light", "Master Bedroom"),
+            ("Desk Lamp", None),
+        ],
+    )
+    def test_single_area(self, name, area):
+        """Test names mentioning one area."""
+        assert _infer_area_from_name(name) == area
+
+    def test_priority_over_position(self):
+        """Test the higher priority area wins regardless of where it appears."""
+        assert _infer_area_from_name("Office Kitchen Light") == "Kitchen"
+        assert _infer_area_from_name("Garage Bedroom Strip") == "Bedroom"
@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
+from copy import copy
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from homeassistant.util.percentage import (
+    ordered_list_item_to_percentage,
+    percentage_to_ordered_list_item,
+)
 
 from custom_components.govee.fan import (
     GoveeFanEntity,
     ORDERED_NAMED_FAN_SPEEDS,
+    _MODE_VALUE_TO_PERCENTAGE,
+    _percentage_to_mode_value,
     PRESET_MODE_NORMAL,
     PRESET_MODE_AUTO,
     WORK_MODE_GEAR,
@@ -126,6 +133,50 @@ class TestGoveeFanEntity:
         mock_coordinator.get_state.return_value = mock_fan_device_state
         assert fan_entity.oscillating is False
 
+    def test_state_refreshed_on_coordinator_update(
+        self, fan_entity, mock_coordinator, mock_fan_device_state
+    ):
+        """Test a state object replaced by a poll is picked up on update."""
+        replacement = copy(mock_fan_device_state)
+        replacement.power_state = False
+        mock_coordinator.get_state.return_value = replacement
+        fan_entity.async_write_ha_state = MagicMock()
+
+        # Cached reference is kept until the coordinator notifies the entity
+        assert fan_entity.is_on is True
+
+        fan_entity._handle_coordinator_update()
+
+        assert fan_entity.is_on is False
+        fan_entity.async_write_ha_state.assert_called_once()
+
+
+# ==============================================================================
+# Percentage Mapping Tests
+# ==============================================================================
+
+
+class TestPercentageMapping:
+    """Test the fan's speed mapping matches HA's ordered list helpers."""
+
+    def test_percentage_to_mode_value(self):
+        """Test every percentage maps to the same speed as the HA helper."""
+        for percentage in range(1, 101):
+            speed = percentage_to_ordered_list_item(
+                ORDERED_NAMED_FAN_SPEEDS, percentage
+            )
+            assert (
+                _percentage_to_mode_value(percentage)
+                == ORDERED_NAMED_FAN_SPEEDS.index(speed) + 1
+            )
+
+    def test_mode_value_to_percentage(self):
+        """Test each speed maps to the same percentage as the HA helper."""
+        for mode_value, speed in enumerate(ORDERED_NAMED_FAN_SPEEDS, start=1):
+            assert _MODE_VALUE_TO_PERCENTAGE[
+                mode_value
+            ] == ordered_list_item_to_percentage(ORDERED_NAMED_FAN_SPEEDS, speed)
+
 
 # ==============================================================================
 # Fan Entity Control Tests
@@ -0,0 +1,228 @@
+"""Test Govee light platform."""
+
+from __future__ import annotations
+
+from copy import copy
+from dataclasses import replace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from homeassistant.components.light import (
+    ATTR_BRIGHTNESS,
+    ATTR_RGB_COLOR,
+    ColorMode,
+)
+
+from custom_components.govee.light import GoveeLightEntity
+from custom_components.govee.models import (
+    POWER_ON,
+    BrightnessCommand,
+    ColorCommand,
+    RGBColor,
+)
+from custom_components.govee.models.device import INSTANCE_BRIGHTNESS, INSTANCE_POWER
+
+# ==============================================================================
+# Light Entity Property Tests
+# ==============================================================================
+
+
+class TestGoveeLightEntity:
+    """Test GoveeLightEntity class."""
+
+    @pytest.fixture
+    def mock_coordinator(self, mock_light_device, mock_device_state):
+        """Create a mock coordinator for testing."""
+        coordinator = MagicMock()
+        coordinator.devices = {mock_light_device.device_id: mock_light_device}
+        coordinator.get_state = MagicMock(return_value=mock_device_state)
+        coordinator.async_control_device = AsyncMock(return_value=True)
+        return coordinator
+
+    @pytest.fixture
+    def light_entity(self, mock_coordinator, mock_light_device):
+        """Create a light entity for testing."""
+        return GoveeLightEntity(mock_coordinator, mock_light_device)
+
+    def test_supported_color_modes(self, light_entity):
+        """Test color modes come from the device capabilities."""
+        assert light_entity.supported_color_modes == {
+            ColorMode.RGB,
+            ColorMode.COLOR_TEMP,
+        }
+
+    def test_color_modes_not_shared(self, mock_coordinator, mock_light_device):
+        """Test lights of the same model don't share one color mode set."""
+        first = GoveeLightEntity(mock_coordinator, mock_light_device)
+        second = GoveeLightEntity(mock_coordinator, mock_light_device)
+
+        first._attr_supported_color_modes.discard(ColorMode.RGB)
+
+        assert ColorMode.RGB in second.supported_color_modes
+
+    def test_traits_read_per_device(self, mock_coordinator, mock_light_device):
+        """Test devices of one model with different capabilities aren't merged."""
+        dimmer = replace(
+            mock_light_device,
+            device_id="AA:BB:CC:DD:EE:FF:00:99",
+            capabilities=tuple(
+                cap
+                for cap in mock_light_device.capabilities
+                if cap.instance in (INSTANCE_POWER, INSTANCE_BRIGHTNESS)
+            ),
+        )
+        GoveeLightEntity(mock_coordinator, mock_light_device)
+
+        light_entity = GoveeLightEntity(mock_coordinator, dimmer)
+
+        assert light_entity.supported_color_modes == {ColorMode.BRIGHTNESS}
+
+    def test_attributes_from_state(self, light_entity):
+        """Test _attr_* fields are filled from the state at construction."""
+        assert light_entity.is_on is True
+        assert light_entity.brightness == 75 * 255 // 100
+        assert light_entity.rgb_color == (255, 128, 64)
+        assert light_entity.color_temp_kelvin is None
+
+    def test_attributes_without_state(self, mock_coordinator, mock_light_device):
+        """Test attributes are unknown when the device has no state yet."""
+        mock_coordinator.get_state.return_value = None
+        light_entity = GoveeLightEntity(mock_coordinator, mock_light_device)
+
+        assert light_entity.is_on is None
+        assert light_entity.brightness is None
+        assert light_entity.rgb_color is None
+        assert light_entity.color_temp_kelvin is None
+
+    def test_state_refreshed_on_coordinator_update(
+        self, light_entity, mock_coordinator, mock_device_state
+    ):
+        """Test a state object replaced by a poll is picked up on update."""
+        replacement = copy(mock_device_state)
+        replacement.power_state = False
+        replacement.brightness = 20
+        mock_coordinator.get_state.return_value = replacement
+        light_entity.async_write_ha_state = MagicMock()
+
+        # Attributes keep the old values until the coordinator notifies
+        assert light_entity.is_on is True
+
+        light_entity._handle_coordinator_update()
+
+        assert light_entity.is_on is False
+        assert light_entity.brightness == 20 * 255 // 100
+        light_entity.async_write_ha_state.assert_called_once()
+
+    def test_optimistic_update_applied_on_notify(self, light_entity, mock_device_state):
+        """Test optimistic changes to the cached state show after a notify."""
+        light_entity.async_write_ha_state = MagicMock()
+
+        mock_device_state.apply_optimistic_color_temp(3000)
+        mock_device_state.apply_optimistic_brightness(50)
+        light_entity._handle_coordinator_update()
+
+        assert light_entity.color_temp_kelvin == 3000
+        assert light_entity.rgb_color is None
+        assert light_entity.brightness == 50 * 255 // 100
+
+        mock_device_state.apply_optimistic_color(RGBColor(r=0, g=0, b=255))
+        light_entity._handle_coordinator_update()
+
+        assert light_entity.rgb_color == (0, 0, 255)
+        assert light_entity.color_temp_kelvin is None
+
+
+# ==============================================================================
+# Turn On Tests
+# ==============================================================================
+
+
+class TestGoveeLightTurnOn:
+    """Test the commands sent by GoveeLightEntity.async_turn_on."""
+
+    @pytest.fixture
+    def mock_coordinator(self, mock_device_state):
+        """Create a mock coordinator for testing."""
+        coordinator = MagicMock()
+        coordinator.get_state = MagicMock(return_value=mock_device_state)
+        coordinator.has_pending_command = MagicMock(return_value=False)
+        coordinator.async_control_device = AsyncMock(return_value=True)
+        return coordinator
+
+    @staticmethod
+    def _sent(coordinator):
+        """Return the commands sent through the coordinator, in order."""
+        return [c.args[1] for c in coordinator.async_control_device.call_args_list]
+
+    @pytest.mark.asyncio
+    async def test_bare_turn_on_sends_power(self, mock_coordinator, mock_light_device):
+        """Test turn_on without attributes only sends power on."""
+        light_entity = GoveeLightEntity(mock_coordinator, mock_light_device)
+
+        await light_entity.async_turn_on()
+
+        assert self._sent(mock_coordinator) == [POWER_ON]
+
+    @pytest.mark.asyncio
+    async def test_brightness_when_on_skips_power(
+        self, mock_coordinator, mock_light_device
+    ):
+        """Test changing brightness of a light that is on sends no power on."""
+        light_entity = GoveeLightEntity(mock_coordinator, mock_light_device)
+
+        await light_entity.async_turn_on(**{ATTR_BRIGHTNESS: 128})
+
+        assert self._sent(mock_coordinator) == [
+            BrightnessCommand(brightness=128 * 100 // 255)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_brightness_after_queued_power_sends_power(
+        self, mock_coordinator, mock_light_device
+    ):
+        """Test power on is sent while a power command is still queued."""
+        mock_coordinator.has_pending_command.return_value = True
+        light_entity = GoveeLightEntity(mock_coordinator, mock_light_device)
+
+        await light_entity.async_turn_on(**{ATTR_BRIGHTNESS: 255})
+
+        assert self._sent(mock_coordinator) == [
+            BrightnessCommand(brightness=100),
+            POWER_ON,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_color_when_off_sends_color_then_power(
+        self, mock_coordinator, mock_light_device, mock_device_state_off
+    ):
+        """Test turning on an off light with a color sets the color first."""
+        mock_coordinator.get_state.return_value = mock_device_state_off
+        light_entity = GoveeLightEntity(mock_coordinator, mock_light_device)
+
+        await light_entity.async_turn_on(**{ATTR_RGB_COLOR: (0, 255, 0)})
+
+        assert self._sent(mock_coordinator) == [
+            ColorCommand(color=RGBColor(r=0, g=255, b=0)),
+            POWER_ON,
+        ]
+        assert light_entity.color_mode == ColorMode.RGB
+
+    @pytest.mark.asyncio
+    async def test_group_always_gets_power(self, mock_coordinator, mock_group_device):
+        """Test a group is sent power on even if its restored state is on."""
+        light_entity = GoveeLightEntity(mock_coordinator, mock_group_device)
+
+        await light_entity.async_turn_on(**{ATTR_BRIGHTNESS: 255})
+
+        assert self._sent(mock_coordinator) == [
+            BrightnessCommand(brightness=100),
+            POWER_ON,
+        ]
+
+    def test_brightness_limits(self, mock_coordinator, mock_light_device):
+        """Test the dimmest setting stays on and full brightness round-trips."""
+        light_entity = GoveeLightEntity(mock_coordinator, mock_light_device)
+
+        assert light_entity._ha_to_device_brightness(1) == 1
+        assert light_entity._ha_to_device_brightness(255) == 100
+        assert light_entity._device_to_ha_brightness(100) == 255
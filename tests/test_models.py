@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import copy
+import pickle
+
 import pytest
 
 from custom_components.govee.models import (
@@ -9,6 +12,8 @@ from custom_components.govee.models import (
     GoveeDeviceState,
     GoveeCapability,
     RGBColor,
+    POWER_OFF,
+    POWER_ON,
     PowerCommand,
     BrightnessCommand,
     ColorCommand,
@@ -18,7 +23,9 @@ from custom_components.govee.models import (
     OscillationCommand,
     WorkModeCommand,
     ModeCommand,
+    ToggleCommand,
     create_dreamview_command,
+    create_night_light_command,
 )
 from custom_components.govee.models.device import (
     CAPABILITY_ON_OFF,
@@ -28,6 +35,7 @@ from custom_components.govee.models.device import (
     CAPABILITY_TOGGLE,
     CAPABILITY_WORK_MODE,
     CAPABILITY_MODE,
+    DEVICE_TYPE_LIGHT,
     INSTANCE_POWER,
     INSTANCE_BRIGHTNESS,
     INSTANCE_COLOR_RGB,
@@ -80,6 +88,10 @@ class TestRGBColor:
         assert color.g == 128
         assert color.b == 64
 
+    def test_from_packed_int_shares_instances(self):
+        """Test that unpacking the same value reuses the color instance."""
+        assert RGBColor.from_packed_int(16744512) is RGBColor.from_packed_int(16744512)
+
     def test_from_dict(self):
         """Test creating color from dict."""
         color = RGBColor.from_dict({"r": 255, "g": 128, "b": 64})
@@ -292,6 +304,44 @@ class TestGoveeDevice:
         assert device.supports_brightness is True
         assert device.supports_rgb is True
 
+    def test_from_api_response_null_type(self, api_device_response):
+        """Test a null or non-string device type falls back to a light."""
+        for raw_type in (None, 42):
+            data = {**api_device_response, "type": raw_type}
+            device = GoveeDevice.from_api_response(data)
+            assert device.device_type == DEVICE_TYPE_LIGHT
+            assert device.is_light_device
+
+    def test_from_api_response_skips_bad_capability(self, api_device_response):
+        """Test a capability with a null type or instance is skipped."""
+        good = api_device_response["capabilities"]
+        data = {
+            **api_device_response,
+            "capabilities": [
+                {"type": None, "instance": INSTANCE_POWER},
+                {"type": CAPABILITY_RANGE, "instance": None},
+                None,
+                *good,
+            ],
+        }
+        device = GoveeDevice.from_api_response(data)
+        assert len(device.capabilities) == len(good)
+        assert device.supports_power
+
+    def test_from_api_response_copy_and_pickle(self, api_device_response):
+        """Test a parsed device, including empty parameters, can be copied."""
+        data = {
+            **api_device_response,
+            "capabilities": [
+                *api_device_response["capabilities"],
+                {"type": CAPABILITY_TOGGLE, "instance": "gradientToggle"},
+            ],
+        }
+        device = GoveeDevice.from_api_response(data)
+
+        assert copy.deepcopy(device) == device
+        assert pickle.loads(pickle.dumps(device)) == device
+
     def test_from_api_response_fan(self, api_fan_device_response):
         """Test creating fan device from API response."""
         device = GoveeDevice.from_api_response(api_fan_device_response)
@@ -304,6 +354,34 @@ class TestGoveeDevice:
         assert device.supports_oscillation is True
         assert device.supports_work_mode is True
 
+    def test_range_helpers(self, mock_light_device, mock_rgbic_device):
+        """Test brightness, color temp and segment parsing."""
+        assert mock_light_device.brightness_range == (0, 100)
+        assert mock_light_device.color_temp_range is not None
+        assert mock_light_device.color_temp_range.min_kelvin == 2000
+        assert mock_light_device.color_temp_range.max_kelvin == 9000
+        assert mock_light_device.segment_count == 0
+        assert mock_rgbic_device.segment_count == 15
+
+    def test_get_capability(self, mock_light_device):
+        """Test capability lookup by type and instance."""
+        cap = mock_light_device.get_capability(CAPABILITY_RANGE, INSTANCE_BRIGHTNESS)
+        assert cap is not None
+        assert cap.is_brightness is True
+        assert mock_light_device.get_capability(CAPABILITY_TOGGLE, INSTANCE_DREAMVIEW) is None
+
+    def test_capability_index_not_compared(self, mock_light_device):
+        """Test that devices with the same fields compare equal."""
+        copy = GoveeDevice(
+            device_id=mock_light_device.device_id,
+            sku=mock_light_device.sku,
+            name=mock_light_device.name,
+            device_type=mock_light_device.device_type,
+            capabilities=mock_light_device.capabilities,
+        )
+        assert copy == mock_light_device
+        assert copy.supports_rgb is True
+
     def test_immutable(self, mock_light_device):
         """Test that GoveeDevice is immutable (frozen)."""
         with pytest.raises(AttributeError):
@@ -586,6 +664,13 @@ class TestCommands:
         cmd = PowerCommand(power_on=False)
         assert cmd.get_value() == 0
 
+    def test_shared_power_commands(self):
+        """Test shared power command instances match freshly built ones."""
+        assert POWER_ON == PowerCommand(power_on=True)
+        assert POWER_OFF == PowerCommand(power_on=False)
+        assert POWER_ON.get_value() == 1
+        assert POWER_OFF.get_value() == 0
+
     def test_brightness_command(self):
         """Test brightness command."""
         cmd = BrightnessCommand(brightness=75)
@@ -692,3 +777,11 @@ class TestCommands:
         assert cmd.get_value() == 0
         payload = cmd.to_api_payload()
         assert payload["value"] == 0
+
+    def test_toggle_factories_share_instances(self):
+        """Test toggle factories reuse one command per state."""
+        assert create_dreamview_command(True) is create_dreamview_command(True)
+        assert create_night_light_command(False) == ToggleCommand(
+            toggle_instance="nightlightToggle", enabled=False
+        )
+        assert create_night_light_command(True).enabled is True